@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+"""
+Throughput and latency benchmarks of DateTimeExprGenerator.
+
+`generate()` is measured in both situations with and without `dt_end`, uncached and with an expression cache
+holding every event (all hits after the first pass), and `generate_list()` with and without `aggregate` on lists
+of 10 events up to 1M events. `generate_batch()` is measured on the same lists as timestamp arrays next to a loop
+of `generate()` over them, both in events per second. Events are drawn from four date distributions relative to
+the reference time: same day, same week, cross-month and cross-year.
+
+```
+$ python benchmarks/bench_datetime.py run --save benchmarks/baseline.json
+$ python benchmarks/bench_datetime.py run --save current.json --sizes 10 1000 100000 1000000
+$ python benchmarks/bench_datetime.py compare benchmarks/baseline.json current.json --threshold 0.1
+```
+
+`compare` prints the change of every case and exits with 1 if any case lost more than `threshold` of its
+throughput, so it can gate an upgrade in CI.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+from datetime import timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from konltk.nlg.datetime import DateTimeExprGenerator, SCHEDULING_DIALOG, SUMMING_UP
+
+
+SITUATIONS = {"scheduling_dialog": SCHEDULING_DIALOG, "summing_up": SUMMING_UP}
+
+# Ranges of event starts in minutes from the reference time
+DISTRIBUTIONS = {
+    "same_day": (-9 * 60, 9 * 60),
+    "same_week": (-3 * 24 * 60, 3 * 24 * 60),
+    "cross_month": (20 * 24 * 60, 45 * 24 * 60),
+    "cross_year": (200 * 24 * 60, 500 * 24 * 60),
+}
+
+DURATIONS = [timedelta(minutes=30), timedelta(hours=1), timedelta(hours=1, minutes=30), timedelta(hours=2),
+             timedelta(days=1)]
+
+DEFAULT_SIZES = [10, 1000, 100000]
+
+GENERATE_CALLS = 20000
+
+
+def make_events(dt_base, distribution, n, seed=0):
+    """
+    Make `n` (start, end, note) tuples sorted by start. Starts fall on 10 minute slots.
+    """
+    rnd = random.Random(seed)
+    low, high = DISTRIBUTIONS[distribution]
+    events = []
+    for _ in range(n):
+        dt = dt_base + timedelta(minutes=rnd.randint(low // 10, high // 10) * 10)
+        events.append((dt, dt + rnd.choice(DURATIONS), rnd.choice([None, None, "회의"])))
+    events.sort(key=lambda event: event[0])
+    return events
+
+
+def measure(func, args_list, min_time=0.2):
+    """
+    Call `func` with each args in `args_list`, repeating the list until `min_time` seconds pass.
+    Return throughput in calls per second and latency percentiles in microseconds.
+    """
+    latencies = []
+    started = time.perf_counter()
+    while True:
+        for args in args_list:
+            t = time.perf_counter()
+            func(*args)
+            latencies.append(time.perf_counter() - t)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+
+    latencies.sort()
+    return {
+        "ops_per_sec": len(latencies) / sum(latencies),
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p99_us": latencies[min(len(latencies) * 99 // 100, len(latencies) - 1)] * 1e6,
+        "calls": len(latencies),
+    }
+
+
+def _generate_loop(generator, dts, dt_ends, dt_base, situation):
+    return [generator.generate(dt, dt_end, dt_base, situation) for dt, dt_end in zip(dts, dt_ends)]
+
+
+def run(sizes, min_time=0.2):
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    generator = DateTimeExprGenerator()
+    cached_generator = DateTimeExprGenerator(cache_size=GENERATE_CALLS * 2)
+    dt_base = generator.tz.localize(datetime(2018, 6, 6, 15))
+    results = {}
+
+    for distribution in sorted(DISTRIBUTIONS):
+        events = make_events(dt_base, distribution, GENERATE_CALLS)
+        for name, situation in sorted(SITUATIONS.items()):
+            for with_end in (False, True):
+                case = "generate/{}/{}/{}".format(name, "with_end" if with_end else "no_end", distribution)
+                args_list = [(dt, dt_end if with_end else None, dt_base, situation) for dt, dt_end, _ in events]
+                results[case] = measure(generator.generate, args_list, min_time)
+                _report(case, results[case])
+
+                case = "generate_cached/" + case.split("/", 1)[1]
+                results[case] = measure(cached_generator.generate, args_list, min_time)
+                _report(case, results[case])
+
+        for size in sizes:
+            dt_range_list = make_events(dt_base, distribution, size, seed=size)
+            for aggregate in (True, False):
+                case = "generate_list/{}/{}/{}".format("aggregate" if aggregate else "flat", distribution, size)
+                results[case] = measure(generator.generate_list, [(dt_range_list, dt_base, aggregate)], min_time)
+                # Throughput of lists is reported in events per second to compare sizes.
+                results[case]["events_per_sec"] = results[case]["ops_per_sec"] * size
+                _report(case, results[case])
+
+            if np is None:
+                continue
+            dts = [dt for dt, _, _ in dt_range_list]
+            dt_ends = [dt_end for _, dt_end, _ in dt_range_list]
+            timestamps = np.array([dt.timestamp() for dt in dts])
+            end_timestamps = np.array([dt_end.timestamp() for dt_end in dt_ends])
+            for name, situation in sorted(SITUATIONS.items()):
+                case = "generate_batch/{}/{}/{}".format(name, distribution, size)
+                results[case] = measure(generator.generate_batch,
+                                        [(timestamps, end_timestamps, dt_base, situation)], min_time)
+                results[case]["events_per_sec"] = results[case]["ops_per_sec"] * size
+                _report(case, results[case])
+
+                case = "generate_loop/{}/{}/{}".format(name, distribution, size)
+                results[case] = measure(_generate_loop, [(generator, dts, dt_ends, dt_base, situation)], min_time)
+                results[case]["events_per_sec"] = results[case]["ops_per_sec"] * size
+                _report(case, results[case])
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "created": datetime.now().isoformat(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold=0.1):
+    """
+    Print the change of throughput of every case. Return cases slower than `threshold`.
+    """
+    regressions = []
+    for case in sorted(set(baseline["results"]) & set(current["results"])):
+        before = baseline["results"][case]["ops_per_sec"]
+        after = current["results"][case]["ops_per_sec"]
+        change = after / before - 1
+        flag = ""
+        if change < -threshold:
+            flag = "  REGRESSION"
+            regressions.append(case)
+        print("{:<55} {:>14.1f} -> {:>14.1f} ops/s {:>+7.1%}{}".format(case, before, after, change, flag))
+
+    for case in sorted(set(baseline["results"]) ^ set(current["results"])):
+        print("{:<55} only in {}".format(case, "baseline" if case in baseline["results"] else "current"))
+
+    return regressions
+
+
+def _report(case, result):
+    print("{:<55} {:>14.1f} ops/s  p50 {:>10.2f}us  p99 {:>10.2f}us".format(
+        case, result["ops_per_sec"], result["p50_us"], result["p99_us"]), file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    commands = parser.add_subparsers(dest="command")
+
+    run_parser = commands.add_parser("run", help="Run benchmarks")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                            help="Sizes of lists for generate_list()")
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds to measure a case")
+    run_parser.add_argument("--save", help="Save results to a JSON file")
+    run_parser.add_argument("--compare", help="Compare results with a baseline JSON file")
+    run_parser.add_argument("--threshold", type=float, default=0.1)
+
+    compare_parser = commands.add_parser("compare", help="Compare two JSON results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="Flag cases that lost more than this fraction of throughput")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        current = run(args.sizes, args.min_time)
+        if args.save:
+            with open(args.save, "w") as f:
+                json.dump(current, f, indent=2, sort_keys=True)
+        if not args.compare:
+            return 0
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    elif args.command == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        parser.print_help()
+        return 2
+
+    return 1 if compare(baseline, current, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+Scaling of `render_threaded()` with the number of threads.
+
+Each case renders the same events with 1 thread up to `--workers` threads and reports throughput and speedup
+over 1 thread. On a free-threaded build of CPython (e.g. `python3.13t` with `PYTHON_GIL=0`) the speedup should
+grow with the number of cores; with the GIL it stays around 1x.
+
+```
+$ python3.13t benchmarks/bench_threads.py --events 200000 --workers 1 2 4 8
+```
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bench_datetime import SITUATIONS, make_events
+from konltk.nlg.datetime import DateTimeExprGenerator, render_threaded
+
+
+def run(n_events, workers_list, chunksize, repeat=3):
+    generator = DateTimeExprGenerator.for_timezone("Asia/Seoul")
+    dt_base = generator.tz.localize(datetime(2018, 6, 6, 15))
+    events = make_events(dt_base, "same_week", n_events)
+    cases = [("generate_list", None)] + [("generate/" + name, situation)
+                                         for name, situation in sorted(SITUATIONS.items())]
+
+    results = {}
+    for name, situation in cases:
+        baseline = None
+        for workers in workers_list:
+            elapsed = min(_measure(events, dt_base, situation, workers, chunksize) for _ in range(repeat))
+            baseline = baseline or elapsed
+            results["{}/{}".format(name, workers)] = {"events_per_sec": n_events / elapsed,
+                                                      "speedup": baseline / elapsed}
+            print("{:<35} {:>2} threads {:>14.1f} events/s {:>6.2f}x".format(
+                name, workers, n_events / elapsed, baseline / elapsed))
+    return results
+
+
+def _measure(events, dt_base, situation, workers, chunksize):
+    started = time.perf_counter()
+    render_threaded(events, dt_base=dt_base, situation=situation, workers=workers, chunksize=chunksize)
+    return time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunksize", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("Python {} ({}), GIL {}, {} CPUs".format(sys.version.split()[0], sys.implementation.name,
+                                                  "enabled" if gil_enabled else "disabled", os.cpu_count()),
+          file=sys.stderr)
+    run(args.events, sorted(args.workers), args.chunksize, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
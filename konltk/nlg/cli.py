@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import csv
+import io
+import json
+import sys
+from konltk.nlg.datetime import DateTimeExprGenerator, SCHEDULING_DIALOG, SUMMING_UP, _from_isoformat
+
+
+"""
+A command-line tool to render Korean date time expressions for a stream of records.
+
+Records are read one at a time from JSONL or CSV with ISO-8601 `dt`, `dt_end` and `note` fields, and expressions
+are written to stdout in buffered chunks, so memory use does not grow with the input.
+
+```
+$ echo '{"dt": "2018-06-07T22:10:00+09:00"}' | konltk-datetime --dt-base 2018-06-06T15:00:00+09:00
+내일 오후 10시 10분
+$ konltk-datetime --list --format csv --dt-base 2018-06-06T15:00:00+09:00 schedule.csv
+6/6(수) 오늘
+15:00 ~ 16:00 정보1
+```
+"""
+
+
+SITUATIONS = {"scheduling_dialog": SCHEDULING_DIALOG, "summing_up": SUMMING_UP}
+
+BUFFER_LINES = 1024
+
+
+def read_records(stream, input_format="jsonl"):
+    """
+    Yield (dt, dt_end, note) tuples from a text stream of JSONL or CSV records.
+    """
+    if input_format == "csv":
+        records = csv.DictReader(stream)
+    else:
+        records = (json.loads(line) for line in stream if line.strip())
+
+    for record in records:
+        dt_end = record.get("dt_end")
+        yield (_from_isoformat(record["dt"]),
+               _from_isoformat(dt_end) if dt_end else None,
+               record.get("note") or None)
+
+
+def main(argv=None, stdin=None, stdout=None):
+    parser = argparse.ArgumentParser(prog="konltk-datetime",
+                                     description="Render Korean date time expressions for JSONL or CSV records.")
+    parser.add_argument("input", nargs="?", default="-", help="An input file. If '-' or omitted, stdin is read.")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="An input format. Guessed from the file name.")
+    parser.add_argument("--situation", choices=sorted(SITUATIONS), default="scheduling_dialog")
+    parser.add_argument("--list", action="store_true", help="Render records as one list like `generate_list()`")
+    parser.add_argument("--no-aggregate", dest="aggregate", action="store_false",
+                        help="Do not group list expressions by day")
+    parser.add_argument("--dt-base", help="A reference datetime in ISO-8601. If omitted, the current time is used.")
+    parser.add_argument("--timezone", default="Asia/Seoul")
+    args = parser.parse_args(argv)
+
+    input_format = args.format or ("csv" if args.input.endswith(".csv") else "jsonl")
+    stdin = stdin or io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    stdout = stdout or io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", write_through=False)
+
+    generator = DateTimeExprGenerator(args.timezone)
+    dt_base = generator.reference(_from_isoformat(args.dt_base) if args.dt_base else None)
+
+    stream = stdin if args.input == "-" else open(args.input, encoding="utf-8", newline="")
+    try:
+        records = read_records(stream, input_format)
+        if args.list:
+            generator.write_list(stdout, records, dt_base=dt_base, aggregate=args.aggregate, buffer_lines=BUFFER_LINES)
+        else:
+            generator.generate_into(stdout, records, dt_base=dt_base, situation=SITUATIONS[args.situation],
+                                    buffer_lines=BUFFER_LINES)
+        stdout.flush()
+    finally:
+        if stream is not stdin:
+            stream.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
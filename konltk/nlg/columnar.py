@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+from konltk.nlg.datetime import DateTimeExprGenerator, SCHEDULING_DIALOG
+from konltk.nlg.exceptions import DateTimeOffsetNaiveException
+
+
+"""
+Columnar adapters render timestamp columns of pandas and Apache Arrow without converting each value into a
+Python `datetime`. Timezone-aware columns are read as UTC `numpy.datetime64` buffers and rendered column-wise with
+`DateTimeExprGenerator.generate_batch()` or, for lists, `DateTimeExprGenerator.generate_list_batch()`.
+
+```
+import pandas as pd
+from konltk.nlg.columnar import generate_column
+
+df = pd.read_parquet("schedules.parquet")
+df["expr"] = generate_column(df["start"], df["end"], dt_base=dt_base)
+```
+
+pandas Series and DatetimeIndex give a pandas Series and Index of strings, and Arrow arrays and chunked arrays
+give an Arrow string array. pandas and pyarrow are only imported for their own columns.
+"""
+
+
+def generate_column(start, end=None, dt_base=None, situation=SCHEDULING_DIALOG, generator=None):
+    """
+    Generate date time expressions for timestamp columns.
+
+    :param start: Timezone-aware start times
+    :type start: pandas.Series or pandas.DatetimeIndex or pyarrow.Array or pyarrow.ChunkedArray
+
+    :param end: Timezone-aware end times of the same kind and length. Nulls mark rows without an end.
+    :type end: pandas.Series or pandas.DatetimeIndex or pyarrow.Array or pyarrow.ChunkedArray
+
+    :param dt_base: A reference datetime or context. If none, `datetime.now()` is used.
+    :type dt_base: datetime.datetime or ReferenceContext
+
+    :param generator: A generator to render with. If none, the shared generator for "Asia/Seoul" is used.
+    :type generator: DateTimeExprGenerator
+    """
+    generator = generator or DateTimeExprGenerator.for_timezone()
+    exprs = generator.generate_batch(_to_datetime64(start, "start"),
+                                     None if end is None else _to_datetime64(end, "end"),
+                                     dt_base=dt_base, situation=situation)
+    return _like(start, exprs)
+
+
+def generate_list_column(start, end=None, note=None, dt_base=None, aggregate=True, generator=None):
+    """
+    Generate the expressions of `generate_list()` for timestamp columns sorted by start, one for each row.
+
+    :param note: Notes of rows. Nulls mark rows without a note.
+    :type note: pandas.Series or pyarrow.Array or pyarrow.ChunkedArray or list
+    """
+    generator = generator or DateTimeExprGenerator.for_timezone()
+    exprs = generator.generate_list_batch(_to_datetime64(start, "start"),
+                                          None if end is None else _to_datetime64(end, "end"),
+                                          None if note is None else _to_list(note),
+                                          dt_base=dt_base, aggregate=aggregate)
+    return _like(start, exprs)
+
+
+def _to_datetime64(column, name):
+    """
+    Return UTC `numpy.datetime64` values of a timezone-aware column, sharing its buffer where possible.
+    """
+    module = type(column).__module__
+    if module.startswith("pyarrow"):
+        import pyarrow as pa
+
+        if isinstance(column, pa.ChunkedArray):
+            column = column.combine_chunks()
+        if not pa.types.is_timestamp(column.type):
+            raise TypeError("`{}` should be a timestamp array".format(name))
+        if column.type.tz is None:
+            raise DateTimeOffsetNaiveException("`{}` has no timezone. All timestamps should be offset-aware.".format(name))
+        # Timestamps with a timezone are stored in UTC.
+        return column.to_numpy(zero_copy_only=False)
+
+    if module.startswith("pandas"):
+        # A Series has its timezone on the `dt` accessor and a DatetimeIndex on itself.
+        values = column.dt if hasattr(column, "dt") else column
+        if getattr(values, "tz", None) is None:
+            raise DateTimeOffsetNaiveException("`{}` has no timezone. All timestamps should be offset-aware.".format(name))
+        return values.tz_convert(None).to_numpy()
+
+    raise TypeError("`{}` should be a pandas Series or DatetimeIndex, or an Arrow timestamp array".format(name))
+
+
+def _to_list(column):
+    module = type(column).__module__
+    if module.startswith("pyarrow"):
+        return column.to_pylist()
+    if module.startswith("pandas"):
+        # Missing values are None or NaN, which is not equal to itself.
+        return [None if value is None or value != value else value for value in column.tolist()]
+    return list(column)
+
+
+def _like(column, exprs):
+    """
+    Wrap expressions into a string column of the same library as `column`.
+    """
+    if type(column).__module__.startswith("pyarrow"):
+        import pyarrow as pa
+
+        return pa.array(exprs, type=pa.string())
+
+    import pandas as pd
+
+    if isinstance(column, pd.Index):
+        return pd.Index(exprs, dtype="string")
+    return pd.Series(exprs, index=column.index, dtype="string")
@@ -1,11 +1,26 @@
 # -*- coding: utf-8 -*-
 
+from codecs import StreamWriter
+from collections import namedtuple
+from collections import OrderedDict
+from datetime import date
 from datetime import datetime
 from datetime import timedelta
-
+from datetime import timezone
+from heapq import merge
+from io import BufferedIOBase
+from io import RawIOBase
+from io import TextIOBase
+from numbers import Real
+from threading import Lock
+from threading import local
+from time import perf_counter
+from time import time
+
+from konltk.nlg.events import EventBlock
 from konltk.nlg.exceptions import DateTimeOffsetNaiveException, UndefinedSituationException
-
-import pytz
+from konltk.nlg.recurrence import Recurrence
+from konltk.nlg.timezones import TimezoneConverter, get_converter
 
 
 """
@@ -59,97 +74,616 @@ datetime(2019, 2, 4, 16)            # "2019년 2월 4일 월요일, 오후 4시"
 SCHEDULING_DIALOG = 0
 SUMMING_UP = 1
 
+RELATIVE_DAYS = {-1: "어제", 0: "오늘", 1: "내일", 2: "모레"}
+
+RELATIVE_WEEKS = {-1: "지난주", 0: "이번주", 1: "다음주"}
+
+WEEKDAYS = ("월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일")
+
+
+StyleProfile = namedtuple('StyleProfile', ['hour24', 'day_of_month', 'date_comma', 'seconds', 'range_joiner'])
+StyleProfile.__new__.__defaults__ = (False, False, True, True, "부터")
+"""
+A style of expressions for a schedule dialog. Summaries keep their compact format in every style.
+
+ * `hour24`: "15시" instead of "오후 3시"
+ * `day_of_month`: "어제(5일)", "모레(8일)" and "다음주 월요일(11일)" instead of "어제", "모레" and "다음주 월요일".
+   오늘 and 내일 are clear without a day.
+ * `date_comma`: a comma after an absolute date, "6월 4일 월요일, 오전 10시"
+ * `seconds`: "오후 3시 10분 30초" instead of "오후 3시 10분"
+ * `range_joiner`: "부터" for "오전 8시부터 10시" or "~" for "오전 8시 ~ 10시"
+
+```
+sms = StyleProfile(hour24=True, date_comma=False, seconds=False, range_joiner="~")
+generator = DateTimeExprGenerator(style=sms)
+```
+"""
+
+DEFAULT_STYLE = StyleProfile()
+
+
+class ReferenceContext(object):
+    """
+        A reference time converted to the generator's timezone with the fields the rules compare against.
+    """
+
+    def __init__(self, dt_base=None, converter=None):
+        """
+        :param dt_base: A reference datetime or POSIX timestamp. If none, `datetime.now()` is used.
+        :type dt_base: datetime.datetime or int or float
+
+        :param converter: A timezone converter of the generator. If none, UTC is used.
+        :type converter: konltk.nlg.timezones.TimezoneConverter
+        """
+        converter = converter or get_converter("UTC")
+        if isinstance(dt_base, Real):
+            self.dt = LocalTime(dt_base, converter.utc_offset(dt_base))
+        elif dt_base:
+            if dt_base.tzinfo is None:
+                raise DateTimeOffsetNaiveException("`dt_base` has no tzinfo. All datetime objects should be offset-aware.")
+            self.dt = converter.to_local(dt_base)
+        else:
+            self.dt = converter.to_local(datetime.now(tz=_UTC))
+
+        self.converter = converter
+        self.year = self.dt.year
+        self.month = self.dt.month
+        self.day = self.dt.day
+        self.ordinal = self.dt.toordinal()
+        self.week = self.dt.isocalendar()[1]
+        self.relative_days = RELATIVE_DAYS
+
+
+# Dates and their fields by ordinal, shared by `LocalTime`s. Cleared when full, and a race at worst makes a date twice.
+_LOCAL_DATES = {}
+_LOCAL_DATES_SIZE = 4096
+
+
+class LocalTime(object):
+    """
+        Local date and time fields of a POSIX timestamp computed with integer arithmetic.
+        It provides the parts of `datetime.datetime` the rules read, so it renders like a local datetime.
+        The calendar date is a `datetime.date` made from the ordinal, so the civil date and the ISO week are
+        computed in C rather than in Python, and the dates of recently seen days are shared.
+    """
+
+    __slots__ = ('timestamp', 'year', 'month', 'day', 'hour', 'minute', 'second', 'ordinal', 'date')
+
+    tzinfo = None
+
+    def __init__(self, timestamp, utc_offset=0):
+        """
+        :param timestamp: A POSIX timestamp in seconds
+        :type timestamp: int or float
+
+        :param utc_offset: The UTC offset in seconds at `timestamp`
+        :type utc_offset: int
+        """
+        self.timestamp = timestamp
+        days, seconds = divmod(int(timestamp // 1) + utc_offset, 86400)
+        self.hour, seconds = divmod(seconds, 3600)
+        self.minute, self.second = divmod(seconds, 60)
+        self.ordinal = ordinal = days + 719163
+        fields = _LOCAL_DATES.get(ordinal)
+        if fields is None:
+            if len(_LOCAL_DATES) >= _LOCAL_DATES_SIZE:
+                _LOCAL_DATES.clear()
+            local_date = date.fromordinal(ordinal)
+            fields = _LOCAL_DATES[ordinal] = (local_date, local_date.year, local_date.month, local_date.day)
+        self.date, self.year, self.month, self.day = fields
+
+    def __sub__(self, other):
+        return timedelta(seconds=self.timestamp - other.timestamp)
+
+    def __repr__(self):
+        return "LocalTime({}-{:02}-{:02} {:02}:{:02}:{:02})".format(self.year, self.month, self.day,
+                                                                     self.hour, self.minute, self.second)
+
+    def toordinal(self):
+        return self.ordinal
+
+    def weekday(self):
+        return (self.ordinal + 6) % 7
+
+    def isocalendar(self):
+        return self.date.isocalendar()
+
+
 class DateTimeExprGenerator(object):
     """
         A simple rule based time expression generator.
+
+        A generator can be shared by any number of threads. Rendering only reads tables built on construction,
+        the optional cache and stats are guarded by locks, and the few values loaded lazily (`tz` and the numpy
+        tables of converters) are idempotent, so a race at worst loads them twice.
     """
 
-    def __init__(self, timezone="Asia/Seoul"):
-        self.tz = pytz.timezone(timezone)
+    def __init__(self, timezone="Asia/Seoul", cache_size=0, cache_policy="lru", engine="table", stats=None,
+                 horizon=0, clock=time, style=DEFAULT_STYLE):
+        """
+        :param timezone: A timezone name of expressions
+        :type timezone: str
+
+        :param cache_size: The maximum number of expressions `generate()` keeps. 0 disables the cache.
+                           Summaries of a single datetime render faster than a cache lookup and are not cached.
+        :type cache_size: int
+
+        :param cache_policy: Which expression to evict when the cache is full, "lru" or "fifo"
+        :type cache_policy: str
+
+        :param engine: How to convert datetimes into the timezone: "table" (precomputed UTC offset transitions),
+                       "zoneinfo", "pytz" or a `konltk.nlg.timezones.TimezoneConverter` instance
+        :type engine: str or konltk.nlg.timezones.TimezoneConverter
+
+        :param stats: Collects time spent in each phase of `generate()` and which date rule fired.
+                      If none, nothing is measured and the generator runs uninstrumented.
+        :type stats: GeneratorStats
+
+        :param horizon: The number of days before and after a reference date whose date phrases are precomputed
+                        the first time the reference date is seen, e.g. 400. Dates in the window are then
+                        rendered by one lookup. 0 disables precomputation.
+        :type horizon: int
+
+        :param clock: A callable returning the current POSIX timestamp, read when `dt_base` is none
+        :type clock: callable
+
+        :param style: The style of expressions for a schedule dialog. It is compiled into token tables on
+                      construction, so every style renders as fast as the default one.
+        :type style: StyleProfile
+        """
+        self.timezone = timezone
+        self.converter = get_converter(timezone, engine)
+        self.__tz = None
+        self.stats = stats
+        self.__tokens = _token_tables()
+        self.style = style
+        self.__style = _style_tables(style)
+        self.__cache = _ExpressionCache(cache_size, cache_policy) if cache_size else None
+
+        if horizon < 0:
+            raise ValueError("`horizon` should not be negative")
+        self.__horizon = horizon
+        self.__horizons = {}
+        self.__horizons_lock = Lock()
+
+        self.clock = clock
+        self.__today = None
+        self.__count_rule = None
+
+        if stats is not None:
+            self.__instrument(stats)
+
+    @classmethod
+    def for_timezone(cls, timezone="Asia/Seoul"):
+        """
+        Return a generator for the timezone, constructed once per process and shared afterwards.
+
+        Shared generators have no cache or stats, and all of their state is built on construction or is a
+        read-only table, so they can be used from any number of threads. Do not modify their attributes.
+        """
+        generator = _GENERATORS.get(timezone)
+        if generator is None:
+            with _GENERATORS_LOCK:
+                generator = _GENERATORS.get(timezone)
+                if generator is None:
+                    generator = _GENERATORS[timezone] = cls(timezone)
+        return generator
+
+    @property
+    def tz(self):
+        """
+        The pytz timezone of the generator. pytz is loaded on first access.
+        """
+        if self.__tz is None:
+            import pytz
+            self.__tz = pytz.timezone(self.timezone)
+        return self.__tz
 
     def generate(self, dt, dt_end=None, dt_base=None, situation=SCHEDULING_DIALOG):
         """
         Generate a date time expression in Korean.
 
-        :param dt: A datetime to generate an expression
-        :type dt: datetime.datetime
+        :param dt: A datetime to generate an expression, or an `EventBlock` or a bounded `Recurrence` to generate
+                   a list of expressions, one for each event
+        :type dt: datetime.datetime or konltk.nlg.events.EventBlock or konltk.nlg.recurrence.Recurrence
 
         :param dt_end: A datetime to generate a time range expression
         :type dt_end: datetime.datetime
 
-        :param dt_base: A reference datetime. If none, `datetime.now()` is used.
-        :type dt: datetime.datetime
+        :param dt_base: A reference datetime or context. If none, `datetime.now()` is used.
+        :type dt_base: datetime.datetime or ReferenceContext
         """
-        assert isinstance(dt, datetime), "`dt` should be a `datetime.datetime` instance"
-        
-        if dt_base:
-            if dt_base.tzinfo is None:
-                raise DateTimeOffsetNaiveException("`dt_base` has no tzinfo. All datetime objects should be offset-aware.")
-            dt_base = dt_base.astimezone(self.tz)
-        else:
-            dt_base = datetime.now(tz=pytz.UTC).astimezone(self.tz)
+        if not isinstance(dt, datetime):
+            assert isinstance(dt, (EventBlock, Recurrence)), \
+                "`dt` should be a `datetime.datetime` instance, an `EventBlock` or a `Recurrence`"
+            if isinstance(dt, Recurrence) and not dt.bounded:
+                raise ValueError("The recurrence has no end. Generate occurrences in a window with `between()`.")
+
+            dt_base = self.reference(dt_base)
+            if isinstance(dt, EventBlock):
+                return [self.generate_timestamp(ts, ts_end, ts_base=dt_base, situation=situation)
+                        for ts, ts_end, _ in dt]
+            return [self.generate(start, end, dt_base=dt_base, situation=situation) for start, end, _ in dt]
+
+        dt_base = self.reference(dt_base)
 
         if dt.tzinfo is None:
             raise DateTimeOffsetNaiveException("`dt` has no tzinfo. All datetime objects should be offset-aware.")
-        dt = dt.astimezone(self.tz)
+        dt = self.converter.to_local(dt)
 
         if dt_end:
             if dt_end.tzinfo is None:
                 raise DateTimeOffsetNaiveException("`dt_end` has no tzinfo. All datetime objects should be offset-aware.")
-            dt_end = dt_end.astimezone(self.tz)
+            dt_end = self.converter.to_local(dt_end)
+
+        if self.__cache is None or (situation == SUMMING_UP and not dt_end):
+            return self.__generate(dt, dt_end, dt_base, situation)
+
+        key = self.__cache_key(dt, dt_end, dt_base, situation)
+        dt_expr = self.__cache.get(key)
+        if dt_expr is None:
+            dt_expr = self.__generate(dt, dt_end, dt_base, situation)
+            self.__cache.put(key, dt_expr)
+        return dt_expr
+
+    def reference(self, dt_base=None):
+        """
+        Make a reference context to pass as `dt_base` when many expressions share the same reference time.
+
+        :param dt_base: A reference datetime or POSIX timestamp. If none, the context of the current day by
+                        `clock` is used. It is made once a day and replaced when the clock passes local midnight,
+                        which is also when a new week starts, so its time of day is when it was made.
+        :type dt_base: datetime.datetime or int or float or ReferenceContext
+        """
+        if dt_base is None:
+            return self.__today_reference()
+        if isinstance(dt_base, ReferenceContext):
+            if dt_base.converter == self.converter:
+                return dt_base
+            dt_base = dt_base.dt.timestamp if isinstance(dt_base.dt, LocalTime) else dt_base.dt
+        return ReferenceContext(dt_base, self.converter)
+
+    def __today_reference(self):
+        """
+        Return the context of the current local day. Expressions depend only on the date of the reference,
+        so the context is reused until the clock leaves the day.
+        """
+        now = self.clock()
+        today = self.__today
+        if today is not None and today[0] <= now < today[1]:
+            return today[2]
+
+        context = ReferenceContext(now, self.converter)
+        # The bounds are computed with the converter, so days shortened or lengthened by DST end exactly at
+        # their local midnight. A single tuple is assigned, so other threads see the old day or the new one.
+        midnight = self.converter.localize(datetime.fromordinal(context.ordinal)).timestamp()
+        next_midnight = self.converter.localize(datetime.fromordinal(context.ordinal + 1)).timestamp()
+        self.__today = (midnight, next_midnight, context)
+        return context
+
+    def generate_timestamp(self, ts, ts_end=None, ts_base=None, situation=SCHEDULING_DIALOG):
+        """
+        Generate a date time expression in Korean from POSIX timestamps without making datetime objects.
+
+        :param ts: A POSIX timestamp to generate an expression
+        :type ts: int or float
+
+        :param ts_end: A POSIX timestamp to generate a time range expression
+        :type ts_end: int or float
+
+        :param ts_base: A reference POSIX timestamp, datetime or context. If none, `datetime.now()` is used.
+        :type ts_base: int or float or datetime.datetime or ReferenceContext
+        """
+        dt = LocalTime(ts, self.converter.utc_offset(ts))
+        if ts_end is None:
+            return self.__generate(dt, None, self.reference(ts_base), situation)
+
+        dt_end = LocalTime(ts_end, self.converter.utc_offset(ts_end))
+        return self.__generate(dt, dt_end, self.reference(ts_base), situation, delta=ts_end - ts)
+
+    def generate_timestamps(self, ts_list, ts_end_list=None, ts_base=None, situation=SCHEDULING_DIALOG):
+        """
+        Generate date time expressions in Korean from sequences of POSIX timestamps.
+
+        :param ts_list: POSIX timestamps to generate expressions
+        :type ts_list: iterable(int or float)
+
+        :param ts_end_list: POSIX timestamps to generate time range expressions. `None` marks an item without an end.
+        :type ts_end_list: iterable(int or float)
+
+        :param ts_base: A reference POSIX timestamp, datetime or context. If none, `datetime.now()` is used.
+        :type ts_base: int or float or datetime.datetime or ReferenceContext
+        """
+        if situation not in (SCHEDULING_DIALOG, SUMMING_UP):
+            raise UndefinedSituationException("Invalid situation provided.")
+
+        ts_base = self.reference(ts_base)
+        if ts_end_list is None:
+            return [self.generate_timestamp(ts, ts_base=ts_base, situation=situation) for ts in ts_list]
+        return [self.generate_timestamp(ts, ts_end, ts_base=ts_base, situation=situation)
+                for ts, ts_end in zip(ts_list, ts_end_list)]
+
+    def generate_into(self, stream, dt_range_iter, dt_base=None, situation=SCHEDULING_DIALOG, buffer_lines=1024):
+        """
+        Write the expression of each item of `dt_range_iter` followed by a line break into a stream.
+        Return the number of expressions written.
+
+        :param stream: A text stream, or a binary stream such as `io.BytesIO` or a socket file, written in UTF-8
+        :type stream: io.TextIOBase or io.BufferedIOBase or io.RawIOBase
+
+        :param dt_range_iter: An iterable of (start, end, note) tuples. Starts and ends may also be POSIX timestamps.
+        :type dt_range_iter: iterable((datetime.datetime, datetime.datetime, str))
+
+        :param buffer_lines: The number of expressions joined, encoded and written at once
+        :type buffer_lines: int
+        """
+        if situation not in (SCHEDULING_DIALOG, SUMMING_UP):
+            raise UndefinedSituationException("Invalid situation provided.")
+
+        dt_base = self.reference(dt_base)
+        exprs = (self.generate(dt, dt_end, dt_base=dt_base, situation=situation) if isinstance(dt, datetime)
+                 else self.generate_timestamp(dt, dt_end, ts_base=dt_base, situation=situation)
+                 for dt, dt_end, _ in dt_range_iter)
+        return _write_lines(stream, exprs, buffer_lines)
+
+    def write_list(self, stream, dt_range_iter, dt_base=None, aggregate=True, buffer_lines=1024):
+        """
+        Write the expressions of `generate_list()` into a stream, one per line, without building the list.
+        Return the number of expressions written.
+
+        :param stream: A text stream, or a binary stream such as `io.BytesIO` or a socket file, written in UTF-8
+        :type stream: io.TextIOBase or io.BufferedIOBase or io.RawIOBase
+
+        :param dt_range_iter: An iterable of (start, end, note) tuples sorted by start
+        :type dt_range_iter: iterable((datetime.datetime, datetime.datetime, str))
+
+        :param buffer_lines: The number of expressions joined, encoded and written at once
+        :type buffer_lines: int
+        """
+        return _write_lines(stream, self.iter_list(dt_range_iter, dt_base=dt_base, aggregate=aggregate), buffer_lines)
+
+    def cache_info(self):
+        """
+        Return statistics of the expression cache as `CacheInfo(hits, misses, maxsize, currsize)`.
+        """
+        if self.__cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self.__cache.info()
+
+    def cache_clear(self):
+        """
+        Clear the expression cache and its statistics.
+        """
+        if self.__cache is not None:
+            self.__cache.clear()
 
+    def generate_batch(self, dts, dt_ends=None, dt_base=None, situation=SCHEDULING_DIALOG):
+        """
+        Generate date time expressions in Korean for arrays of datetimes at once.
+
+        The rules run column-wise with NumPy: local dates, weekdays, ISO weeks and the day and week differences
+        from the reference are computed as arrays, each rule selects its rows with a mask, and phrases are
+        assembled by indexing arrays of tokens. No `datetime` is made for a row.
+
+        :param dts: Start datetimes as `numpy.datetime64` values in UTC or POSIX timestamps in seconds
+        :type dts: array-like
+
+        :param dt_ends: End datetimes in the same form as `dts`. NaT or NaN marks a row without an end.
+        :type dt_ends: array-like
+
+        :param dt_base: A reference datetime or context. If none, `datetime.now()` is used.
+        :type dt_base: datetime.datetime or ReferenceContext
+        """
+        np = _import_numpy("generate_batch")
+
+        if situation not in (SCHEDULING_DIALOG, SUMMING_UP):
+            raise UndefinedSituationException("Invalid situation provided.")
+
+        dt_base = self.reference(dt_base)
+        columns = self.__batch_columns(np, dts, dt_ends)
+        if columns is None:
+            return []
+
+        tables = _batch_tables(np, self.style)
+        if situation == SCHEDULING_DIALOG:
+            return _batch_scheduling_dialog(np, tables, dt_base, *columns).tolist()
+        return _batch_summing_up(np, tables, dt_base, *columns).tolist()
+
+    def generate_list_batch(self, dts, dt_ends=None, notes=None, dt_base=None, aggregate=True):
+        """
+        Generate the expressions of `generate_list()` for arrays of datetimes sorted by start, column-wise like
+        `generate_batch()`.
+
+        :param dts: Start datetimes as `numpy.datetime64` values in UTC or POSIX timestamps in seconds
+        :type dts: array-like
+
+        :param dt_ends: End datetimes in the same form as `dts`. NaT or NaN marks a row without an end.
+        :type dt_ends: array-like
+
+        :param notes: Notes of rows. None or an empty string marks a row without a note.
+        :type notes: sequence(str)
+
+        :param dt_base: A reference datetime or context. If none, `datetime.now()` is used.
+        :type dt_base: datetime.datetime or ReferenceContext
+        """
+        np = _import_numpy("generate_list_batch")
+
+        dt_base = self.reference(dt_base)
+        columns = self.__batch_columns(np, dts, dt_ends)
+        if columns is None:
+            return []
+
+        if notes is not None:
+            notes = np.array(notes, dtype=object)
+            if notes.shape != columns[0].days.shape:
+                raise ValueError("`dts` and `notes` should have the same length")
+        return _batch_list(np, _batch_tables(np, self.style), dt_base, aggregate, notes, *columns).tolist()
+
+    def __batch_columns(self, np, dts, dt_ends):
+        """
+        Return local columns of starts, the rows with an end, local columns of their ends and their elapsed
+        seconds, or None if there are no rows.
+        """
+        start = _to_epoch_seconds(np, dts)
+        if start.ndim != 1:
+            raise ValueError("`dts` should be a one-dimensional array")
+        if len(start) == 0:
+            return None
+        if (start == _MISSING).any():
+            raise ValueError("`dts` should not contain missing values")
+
+        if dt_ends is None:
+            rows = np.zeros(0, dtype=np.int64)
+        else:
+            end = _to_epoch_seconds(np, dt_ends)
+            if end.shape != start.shape:
+                raise ValueError("`dts` and `dt_ends` should have the same length")
+            rows = np.flatnonzero(end != _MISSING)
+            end = end[rows]
+
+        start_columns = _local_columns(np, start + self.converter.utc_offsets(np, start))
+        if not len(rows):
+            return start_columns, rows, None, None
+        end_columns = _local_columns(np, end + self.converter.utc_offsets(np, end))
+        elapsed = _to_float_seconds(np, dt_ends, rows) - _to_float_seconds(np, dts, rows)
+        return start_columns, rows, end_columns, elapsed
+
+    def __generate(self, dt, dt_end, dt_base, situation, delta=None):
+        """
+        Generate a date time expression from datetimes already converted to the local timezone.
+        """
         if situation == SCHEDULING_DIALOG:
             dt_expr = "{} {}".format(self.__str_date_for_scheduling_dialog(dt=dt, dt_base=dt_base),
                     self.__str_time_for_scheduling_dialog(dt=dt)).strip()
             if dt_end:
                 dt_end_expr = "{} {}".format(self.__str_date_for_scheduling_dialog(dt=dt_end, dt_base=dt_base, dt_ref=dt),
                         self.__str_time_for_scheduling_dialog(dt=dt_end, dt_ref=dt)).strip()
-                return "{}부터 {}".format(dt_expr, dt_end_expr)
+                return self.__style.range_format.format(dt_expr, dt_end_expr)
             else:
                 return dt_expr
         elif situation == SUMMING_UP:
             dt_expr = self.__str_datetime_for_summing_up(dt=dt, dt_base=dt_base)
             if dt_end:
-                dt_end_expr = self.__str_datetime_for_summing_up(dt=dt_end, dt_base=dt_base, dt_ref=dt)
+                dt_end_expr = self.__str_datetime_for_summing_up(dt=dt_end, dt_base=dt_base, dt_ref=dt, delta=delta)
                 return "{} ~ {}".format(dt_expr, dt_end_expr)
             else:
                 return dt_expr
         else:
             raise UndefinedSituationException("Invalid situation provided.")
 
-    def generate_list(self, dt_range_list, dt_base=None, aggregate=True):
+    def __instrument(self, stats):
+        """
+        Shadow the methods of each phase with timed wrappers on this instance only.
+        """
+        self.generate = stats.timed("validation", self.generate)
+        self.converter = _TimedConverter(self.converter, stats)
+        self.__generate = stats.timed("assembly", self.__generate)
+        self.__str_date_for_scheduling_dialog = stats.timed("date", self.__str_date_for_scheduling_dialog)
+        self.__str_time_for_scheduling_dialog = stats.timed("time", self.__str_time_for_scheduling_dialog)
+        self.__str_datetime_for_summing_up = stats.timed("datetime", self.__str_datetime_for_summing_up)
+        self.__str_date_for_summing_up = stats.timed("date", self.__str_date_for_summing_up)
+        # The date builders report the rule of the branch they return from.
+        self.__count_rule = stats.count_rule
+        self.__str_time_for_summing_up = stats.timed("time", self.__str_time_for_summing_up)
+
+    def __cache_key(self, dt, dt_end, dt_base, situation):
+        """
+        Make a cache key of ints from the fields the rules read: the local time of `dt` and `dt_end` in seconds
+        and the local date of `dt_base`. Summaries also read the elapsed time, which differs from the difference
+        of local times by the change of UTC offset and the microseconds.
+        """
+        seconds = dt.toordinal() * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+        if not dt_end:
+            return situation, dt_base.ordinal, seconds
+
+        end_seconds = dt_end.toordinal() * 86400 + dt_end.hour * 3600 + dt_end.minute * 60 + dt_end.second
+        if situation == SUMMING_UP:
+            return situation, dt_base.ordinal, seconds, end_seconds, dt_end.utcoffset() - dt.utcoffset(), \
+                dt_end.microsecond - dt.microsecond
+        return situation, dt_base.ordinal, seconds, end_seconds
+
+    def generate_list(self, dt_range_list, dt_base=None, aggregate=True, sort=False, merge=False):
         """
         Generate a list of date time expressions in Korean.
 
-        :param dt_range_list: A list of (start, end) datetime tuples
-        :type dt_range_list: list((datetime.datetime, datetime.datetime))
+        :param dt_range_list: A list of (start, end, note) tuples, an `EventBlock` or a bounded `Recurrence`,
+                              sorted by start. With `merge`, a list of such sources.
+        :type dt_range_list: list((datetime.datetime, datetime.datetime, str)) or konltk.nlg.events.EventBlock or
+                             konltk.nlg.recurrence.Recurrence
 
-        :param dt_base: A reference datetime. If none, `datetime.now()` is used.
-        :type dt: datetime.datetime
+        :param dt_base: A reference datetime or context. If none, `datetime.now()` is used.
+        :type dt_base: datetime.datetime or ReferenceContext
+
+        :param sort: Sort events by start first. With `merge`, each source is sorted.
+        :type sort: bool
+
+        :param merge: Merge sources sorted by start, e.g. calendars of a user and a team, into one list
+        :type merge: bool
         """
-        assert isinstance(dt_range_list, list), "`dt_range_list` should be a list"
-        
-        if dt_base:
-            if dt_base.tzinfo is None:
-                raise DateTimeOffsetNaiveException("`dt_base` has no tzinfo. All datetime objects should be offset-aware.")
-            dt_base = dt_base.astimezone(self.tz)
+        if merge:
+            assert isinstance(dt_range_list, list), "`dt_range_list` should be a list of sources"
+            sources = dt_range_list
         else:
-            dt_base = datetime.now(tz=pytz.UTC).astimezone(self.tz)
+            assert isinstance(dt_range_list, (list, EventBlock, Recurrence)), \
+                "`dt_range_list` should be a list, an `EventBlock` or a `Recurrence`"
+            sources = [dt_range_list]
 
-        dt_expr_list = []
-        date_prev = None
+        # Merging and sorting would expand an unbounded recurrence forever, so it is refused before either.
+        for source in sources:
+            if isinstance(source, Recurrence) and not source.bounded:
+                raise ValueError("The recurrence has no end. Generate occurrences in a window with `between()`.")
 
-        for dt, dt_end, note in dt_range_list:
-            if dt.tzinfo is None:
-                raise DateTimeOffsetNaiveException("`dt` has no tzinfo. All datetime objects should be offset-aware.")
-            dt = dt.astimezone(self.tz)
+        if merge:
+            sources = [sort_events(source) for source in sources] if sort else sources
+            return list(self.iter_list(merge_events(sources), dt_base=dt_base, aggregate=aggregate))
+        if sort:
+            dt_range_list = sort_events(dt_range_list)
 
-            if dt_end:
-                if dt_end.tzinfo is None:
-                    raise DateTimeOffsetNaiveException("`dt_end` has no tzinfo. All datetime objects should be offset-aware.")
-                dt_end = dt_end.astimezone(self.tz)
+        return list(self.iter_list(dt_range_list, dt_base=dt_base, aggregate=aggregate))
+
+    def iter_list(self, dt_range_iter, dt_base=None, aggregate=True, dt_prev=None):
+        """
+        Lazily generate date time expressions in Korean, one for each item of `dt_range_iter`.
+        Expressions are the same as those of `generate_list()`.
+
+        :param dt_range_iter: An iterable of (start, end, note) tuples sorted by start.
+                              Starts and ends may also be POSIX timestamps.
+        :type dt_range_iter: iterable((datetime.datetime, datetime.datetime, str))
+
+        :param dt_base: A reference datetime or context. If none, `datetime.now()` is used.
+        :type dt_base: datetime.datetime or ReferenceContext
 
-            date_cur = dt.date()
+        :param dt_prev: The start of the item right before `dt_range_iter` when it continues a longer list
+        :type dt_prev: datetime.datetime
+        """
+        date_prev = None
+        if isinstance(dt_prev, Real) and aggregate:
+            date_prev = LocalTime(dt_prev, self.converter.utc_offset(dt_prev)).toordinal()
+        elif dt_prev and aggregate:
+            if dt_prev.tzinfo is None:
+                raise DateTimeOffsetNaiveException("`dt_prev` has no tzinfo. All datetime objects should be offset-aware.")
+            date_prev = self.converter.to_local(dt_prev).toordinal()
+
+        return self.__iter_list(iter(dt_range_iter), self.reference(dt_base), aggregate, date_prev)
+
+    def __iter_list(self, dt_range_iter, dt_base, aggregate, date_prev=None):
+
+        for dt, dt_end, note in dt_range_iter:
+            if isinstance(dt, datetime):
+                if dt.tzinfo is None:
+                    raise DateTimeOffsetNaiveException("`dt` has no tzinfo. All datetime objects should be offset-aware.")
+                dt = self.converter.to_local(dt)
+
+                if dt_end:
+                    if dt_end.tzinfo is None:
+                        raise DateTimeOffsetNaiveException("`dt_end` has no tzinfo. All datetime objects should be offset-aware.")
+                    dt_end = self.converter.to_local(dt_end)
+            else:
+                dt = LocalTime(dt, self.converter.utc_offset(dt))
+                if dt_end is not None:
+                    dt_end = LocalTime(dt_end, self.converter.utc_offset(dt_end))
+
+            date_cur = dt.toordinal()
             if date_prev != date_cur:
                 dt_expr = self.__str_date_for_summing_up(dt=dt, dt_base=dt_base, add_relative_expr=aggregate)
                 if aggregate:
@@ -166,167 +700,212 @@ class DateTimeExprGenerator(object):
 
             if dt_end:
                 dt_end_expr = self.__str_time_for_summing_up(dt=dt_end, dt_base=dt_base, dt_ref=dt, note=note)
-                dt_expr_list.append("{} ~ {}".format(dt_expr, dt_end_expr))
+                yield "{} ~ {}".format(dt_expr, dt_end_expr)
             else:
-                dt_expr_list.append(dt_expr)
+                yield dt_expr
 
             if aggregate:
                 date_prev = date_cur
 
-        return dt_expr_list
 
+    def __horizon_tables(self, dt_base):
+        """
+        Return date phrases of every day in the horizon of the reference date, and the rules that made them,
+        indexed by day offset + horizon. Tables of the most recent reference dates are kept.
+        """
+        tables = self.__horizons.get(dt_base.ordinal)
+        if tables is None:
+            with self.__horizons_lock:
+                tables = self.__horizons.get(dt_base.ordinal)
+                if tables is None:
+                    # A plain generator renders the tables, so they are neither looked up nor measured.
+                    builder = DateTimeExprGenerator(self.timezone, engine=self.converter, style=self.style)
+                    dates = [datetime.fromordinal(dt_base.ordinal + offset)
+                             for offset in range(-self.__horizon, self.__horizon + 1)]
+
+                    def build(func, **kwargs):
+                        rules = []
+                        builder.__count_rule = rules.append
+                        return tuple(func(dt, dt_base, **kwargs) for dt in dates), tuple(rules)
+
+                    tables = _HorizonTables(
+                        *(build(builder.__str_date_for_scheduling_dialog) +
+                          build(builder.__str_date_for_summing_up, add_relative_expr=False) +
+                          build(builder.__str_date_for_summing_up))
+                    )
+                    if len(self.__horizons) >= _HORIZON_REFERENCES:
+                        del self.__horizons[next(iter(self.__horizons))]
+                    self.__horizons[dt_base.ordinal] = tables
+        return tables
 
     def __str_date_for_scheduling_dialog(self, dt, dt_base, dt_ref=None):
         """
         Generate date expression for a schedule dialog.
         """
+        if dt_ref is None and self.__horizon:
+            offset = dt.toordinal() - dt_base.ordinal
+            if -self.__horizon <= offset <= self.__horizon:
+                tables = self.__horizon_tables(dt_base)
+                if self.__count_rule is not None:
+                    self.__count_rule(tables.scheduling_dialog_rules[offset + self.__horizon])
+                return tables.scheduling_dialog[offset + self.__horizon]
+
+        tokens = self.__tokens
+        style = self.__style
         dt_comp = dt_base if dt_ref is None else dt_ref
+        day_diff = dt.day - dt_base.day
         if dt.year != dt_comp.year or dt.month < dt_comp.month:
-            return "{}년 {}월 {}일 {},".format(dt.year, dt.month, dt.day, self.weekday(dt))
+            rule = "absolute_date"
+            expr = str(dt.year) + "년 " + tokens.months[dt.month] + " " + tokens.days[dt.day] + " " + \
+                tokens.weekdays[dt.weekday()] + style.date_end
         elif dt.month != dt_comp.month:
-            return "{}월 {}일 {},".format(dt.month, dt.day, self.weekday(dt))
-
-        expr = []
-
-        if dt_ref is None or (dt_ref.day != dt.day):
-            day_diff = dt.day - dt_base.day
-            if day_diff == 0:
-                expr.append("오늘")
-            elif day_diff == 1:
-                expr.append("내일")
-            elif day_diff == -1:
-                expr.append("어제")
-            elif day_diff == 2:
-                expr.append("모레")
-            else:
-                if dt_ref is None or (dt_ref.isocalendar()[1] != dt.isocalendar()[1]):
-                    week_diff = dt.isocalendar()[1] - dt_base.isocalendar()[1]
-                    if week_diff not in (-1, 0, 1):
-                        expr.append("{}일 {}".format(dt.day, self.weekday(dt)))
-                    else:
-                        if week_diff == 0:
-                            if day_diff < 0:
-                                expr.append("이번주")
-                        elif week_diff == 1:
-                            expr.append("다음주")
-                        elif week_diff == -1:
-                            expr.append("지난주")
-                        expr.append(self.weekday(dt))
+            rule = "absolute_date"
+            expr = tokens.months[dt.month] + " " + tokens.days[dt.day] + " " + tokens.weekdays[dt.weekday()] + \
+                style.date_end
+        elif dt_ref is not None and dt_ref.day == dt.day:
+            rule = "same_day"
+            expr = ""
+        elif day_diff in dt_base.relative_days:
+            rule = "relative_day"
+            suffixes = style.relative_day_suffixes.get(day_diff, style.day_suffixes)
+            expr = dt_base.relative_days[day_diff] + suffixes[dt.day]
+        else:
+            week_diff = None
+            if dt_ref is None or (dt_ref.isocalendar()[1] != dt.isocalendar()[1]):
+                week_diff = dt.isocalendar()[1] - dt_base.week
+
+            if week_diff == 0:
+                rule = "relative_week"
+                if day_diff < 0:
+                    expr = RELATIVE_WEEKS[0] + " " + tokens.weekdays[dt.weekday()] + style.day_suffixes[dt.day]
                 else:
-                    expr.append("{}일 {}".format(dt.day, self.weekday(dt)))
+                    expr = tokens.weekdays[dt.weekday()] + style.day_suffixes[dt.day]
+            elif week_diff == 1 or week_diff == -1:
+                rule = "relative_week"
+                expr = RELATIVE_WEEKS[week_diff] + " " + tokens.weekdays[dt.weekday()] + style.day_suffixes[dt.day]
+            else:
+                rule = "day_of_month"
+                expr = tokens.days[dt.day] + " " + tokens.weekdays[dt.weekday()]
 
-        return " ".join(expr)
+        if self.__count_rule is not None:
+            self.__count_rule(rule)
+        return expr
 
 
     def __str_time_for_scheduling_dialog(self, dt, dt_ref=None):
         """
         Generate time expression for a schedule dialog.
         """
-        expr = []
+        style = self.__style
 
         if dt_ref is None or dt.year != dt_ref.year or dt.month != dt_ref.month or dt.day != dt_ref.day or \
             (dt.hour < 12 and dt_ref.hour >= 12) or (dt.hour >= 12 and dt_ref.hour < 12):
-            if dt.hour < 12:
-                expr.append("오전")
-            else:
-                expr.append("오후")
-
-        if dt.hour == 0:
-            expr.append("12시")
-        elif dt.hour < 13:
-            expr.append("{}시".format(dt.hour))
+            expr = style.meridiem_hours[dt.hour]
         else:
-            expr.append("{}시".format(dt.hour - 12))
+            expr = style.hours[dt.hour]
 
-        if dt.minute > 0 or dt.second > 0:
-            expr.append("{}분".format(dt.minute))
-        if dt.second > 0:
-            expr.append("{}초".format(dt.second))
+        return expr + style.minute_seconds[dt.minute * 60 + dt.second]
 
-        return " ".join(expr)
 
-
-    def __str_datetime_for_summing_up(self, dt, dt_base, dt_ref=None):
+    def __str_datetime_for_summing_up(self, dt, dt_base, dt_ref=None, delta=None):
         """
         Generate date expression for a schedule summary.
         """
-        expr = []
+        tokens = self.__tokens
+        if dt_ref is None and self.__horizon:
+            offset = dt.toordinal() - dt_base.ordinal
+            if -self.__horizon <= offset <= self.__horizon:
+                tables = self.__horizon_tables(dt_base)
+                if self.__count_rule is not None:
+                    self.__count_rule(tables.summing_up_rules[offset + self.__horizon])
+                return tables.summing_up[offset + self.__horizon] + " " + tokens.clock[dt.hour * 60 + dt.minute]
+
         dt_comp = dt_base if dt_ref is None else dt_ref
 
         if dt.year != dt_comp.year or dt.month < dt_comp.month:
-            expr.append("{}/{}/{}({})".format(dt.year, dt.month, dt.day, self.weekday(dt, simple=True)))
+            rule = "absolute_date"
+            expr = str(dt.year) + "/" + tokens.month_days[dt.month][dt.day] + \
+                tokens.short_weekdays[dt.weekday()] + " " + tokens.clock[dt.hour * 60 + dt.minute]
         elif dt_ref is None or dt.month != dt_ref.month:
-            expr.append("{}/{}({})".format(dt.month, dt.day, self.weekday(dt, simple=True)))
+            rule = "month_day"
+            expr = tokens.month_days[dt.month][dt.day] + tokens.short_weekdays[dt.weekday()] + " " + \
+                tokens.clock[dt.hour * 60 + dt.minute]
         elif dt_ref is None or dt.day != dt_ref.day:
-            expr.append("{}({})".format(dt.day, self.weekday(dt, simple=True)))
-
-        expr.append("{:02}:{:02}".format(dt.hour, dt.minute))
+            rule = "day_of_month"
+            expr = str(dt.day) + tokens.short_weekdays[dt.weekday()] + " " + tokens.clock[dt.hour * 60 + dt.minute]
+        else:
+            rule = "same_day"
+            expr = tokens.clock[dt.hour * 60 + dt.minute]
 
         if dt_ref is not None:
-            delta = (dt - dt_ref).total_seconds()
+            if delta is None:
+                delta = _elapsed_seconds(dt, dt_ref)
             if delta >= 59 and delta < 60*60*24:
-                delta_expr = []
-                hours, remainder = divmod(delta, 3600)
-                minutes, seconds = divmod(remainder, 60)
-                if hours > 0:
-                    delta_expr.append("{:.0f}시간".format(hours))
-                if minutes > 0:
-                    delta_expr.append("{:.0f}분".format(minutes))
-                expr.append("({})".format(" ".join(delta_expr)))
+                expr += " " + tokens.durations[int(delta // 60)]
 
-        return " ".join(expr)
+        if self.__count_rule is not None:
+            self.__count_rule(rule)
+        return expr
 
     def __str_date_for_summing_up(self, dt, dt_base, dt_ref=None, add_relative_expr=True):
         """
         Generate date expression for a schedule summary.
         """
-        expr = []
+        if dt_ref is None and self.__horizon:
+            offset = dt.toordinal() - dt_base.ordinal
+            if -self.__horizon <= offset <= self.__horizon:
+                tables = self.__horizon_tables(dt_base)
+                if add_relative_expr:
+                    rule, expr = tables.summing_up_relative_rules, tables.summing_up_relative
+                else:
+                    rule, expr = tables.summing_up_rules, tables.summing_up
+                if self.__count_rule is not None:
+                    self.__count_rule(rule[offset + self.__horizon])
+                return expr[offset + self.__horizon]
+
+        tokens = self.__tokens
         dt_comp = dt_base if dt_ref is None else dt_ref
 
         if dt.year != dt_comp.year or dt.month < dt_comp.month:
-            expr.append("{}/{}/{}({})".format(dt.year, dt.month, dt.day, self.weekday(dt, simple=True)))
+            rule = "absolute_date"
+            expr = str(dt.year) + "/" + tokens.month_days[dt.month][dt.day] + tokens.short_weekdays[dt.weekday()]
         elif dt_ref is None or dt.month != dt_ref.month:
-            expr.append("{}/{}({})".format(dt.month, dt.day, self.weekday(dt, simple=True)))
+            rule = "month_day"
+            expr = tokens.month_days[dt.month][dt.day] + tokens.short_weekdays[dt.weekday()]
         elif dt_ref is None or dt.day != dt_ref.day:
-            expr.append("{}({})".format(dt.day, self.weekday(dt, simple=True)))
+            rule = "day_of_month"
+            expr = str(dt.day) + tokens.short_weekdays[dt.weekday()]
+        else:
+            rule = "same_day"
+            expr = ""
 
         if add_relative_expr:
             day_diff = dt.day - dt_base.day
-            if day_diff == 0:
-                expr.append("오늘")
-            elif day_diff == 1:
-                expr.append("내일")
-            elif day_diff == -1:
-                expr.append("어제")
-            elif day_diff == 2:
-                expr.append("모레")
+            if day_diff in dt_base.relative_days:
+                rule = "relative_day"
+                if expr:
+                    expr = expr + " " + dt_base.relative_days[day_diff]
+                else:
+                    expr = dt_base.relative_days[day_diff]
 
-        return " ".join(expr)
+        if self.__count_rule is not None:
+            self.__count_rule(rule)
+        return expr
 
     def __str_time_for_summing_up(self, dt, dt_base, dt_ref=None, note=None):
         """
         Generate time expression for a schedule summary.
         """
-        expr = []
-        dt_comp = dt_base if dt_ref is None else dt_ref
-
-        expr.append("{:02}:{:02}".format(dt.hour, dt.minute))
+        expr = self.__tokens.clock[dt.hour * 60 + dt.minute]
 
         if note:
-            expr.append("{}".format(note))
+            return expr + " " + str(note)
         elif dt_ref is not None:
-            delta = (dt - dt_ref).total_seconds()
+            delta = _elapsed_seconds(dt, dt_ref)
             if delta >= 59 and delta < 60*60*24:
-                delta_expr = []
-                hours, remainder = divmod(delta, 3600)
-                minutes, seconds = divmod(remainder, 60)
-                if hours > 0:
-                    delta_expr.append("{:.0f}시간".format(hours))
-                if minutes > 0:
-                    delta_expr.append("{:.0f}분".format(minutes))
-                expr.append("({})".format(" ".join(delta_expr)))
+                return expr + " " + self.__tokens.durations[int(delta // 60)]
 
-        return " ".join(expr)
+        return expr
 
 
     def weekday(self, dt, simple=False):
@@ -336,9 +915,767 @@ class DateTimeExprGenerator(object):
         :param simple: Simple version (월, 화, 수) or full version (월요일, 화요일, 수요일)
         :type simple: bool
         """
-        weekdays = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
         if simple:
-            return weekdays[dt.weekday()][0]
+            return WEEKDAYS[dt.weekday()][0]
+        else:
+            return WEEKDAYS[dt.weekday()]
+
+
+_GENERATORS = {}
+_GENERATORS_LOCK = Lock()
+
+_UTC = timezone.utc
+
+
+def merge_events(sources):
+    """
+    Lazily merge iterables of (start, end, note) tuples, each sorted by start, into one sequence sorted by start.
+    Events starting at the same time keep the order of their sources. Pass the result to `iter_list()` to stream
+    a summary of many calendars.
+
+    :param sources: Iterables of (start, end, note) tuples or `EventBlock`s. Starts may be datetimes or timestamps.
+    :type sources: iterable(iterable((datetime.datetime, datetime.datetime, str)))
+    """
+    return merge(*sources, key=_event_start)
+
+
+def sort_events(events):
+    """
+    Return a list of (start, end, note) tuples sorted by start. Events starting at the same time keep their order.
+    """
+    return sorted(events, key=_event_start)
+
+
+def _event_start(event):
+    dt = event[0]
+    return dt.timestamp() if isinstance(dt, datetime) else dt
+
+
+def render_by_timezone(items, dt_base=None, situation=SCHEDULING_DIALOG):
+    """
+    Render items that each name their own timezone. Items are grouped by timezone and rendered with the
+    shared generator of each zone against one reference context per zone. Results are in the order of `items`.
+
+    :param items: (timezone, start, end) tuples. Starts and ends may be datetimes or POSIX timestamps.
+    :type items: iterable((str, datetime.datetime, datetime.datetime))
+
+    :param dt_base: A reference datetime or POSIX timestamp. If none, `datetime.now()` is used for all items.
+    :type dt_base: datetime.datetime or int or float
+    """
+    if situation not in (SCHEDULING_DIALOG, SUMMING_UP):
+        raise UndefinedSituationException("Invalid situation provided.")
+    if dt_base is None:
+        dt_base = datetime.now(tz=_UTC)
+
+    groups = {}
+    for index, (timezone_name, dt, dt_end) in enumerate(items):
+        groups.setdefault(timezone_name, []).append((index, dt, dt_end))
+
+    exprs = [None] * sum(len(group) for group in groups.values())
+    for timezone_name, group in groups.items():
+        generator = DateTimeExprGenerator.for_timezone(timezone_name)
+        reference = generator.reference(dt_base)
+        for index, dt, dt_end in group:
+            if isinstance(dt, datetime):
+                exprs[index] = generator.generate(dt, dt_end, dt_base=reference, situation=situation)
+            else:
+                exprs[index] = generator.generate_timestamp(dt, dt_end, ts_base=reference, situation=situation)
+    return exprs
+
+
+def render_parallel(events, dt_base=None, situation=None, aggregate=True, timezone="Asia/Seoul", workers=None,
+                    chunksize=10000):
+    """
+    Render many expressions over a process pool. Results are returned in the order of `events`.
+
+    :param events: (start, end, note) tuples, sorted by start when `situation` is None
+    :type events: iterable((datetime.datetime, datetime.datetime, str))
+
+    :param dt_base: A reference datetime or context. If none, `datetime.now()` is used for all events.
+    :type dt_base: datetime.datetime or ReferenceContext
+
+    :param situation: `SCHEDULING_DIALOG` or `SUMMING_UP` to render each event with `generate()`.
+                      If none, events are rendered as one list with `generate_list()`.
+    :type situation: int
+
+    :param workers: The number of worker processes. If none, the number of CPUs is used.
+    :type workers: int
+
+    :param chunksize: The number of events sent to a worker at once
+    :type chunksize: int
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    dt_base = DateTimeExprGenerator(timezone).reference(dt_base)
+    chunks = _split_chunks(events, dt_base, situation, aggregate, chunksize)
+    if not chunks:
+        return []
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(timezone,)) as executor:
+        return [dt_expr for dt_expr_list in executor.map(_render_chunk, chunks) for dt_expr in dt_expr_list]
+
+
+def render_threaded(events, dt_base=None, situation=None, aggregate=True, timezone="Asia/Seoul", workers=None,
+                    chunksize=10000):
+    """
+    Render many expressions over a thread pool with the shared generator of the timezone. Results are returned
+    in the order of `events`. Nothing is pickled, but threads only run in parallel on free-threaded builds of
+    Python; elsewhere prefer `render_parallel()` for large inputs.
+
+    Parameters are the same as `render_parallel()`, except that `workers` is the number of threads.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    generator = DateTimeExprGenerator.for_timezone(timezone)
+    chunks = _split_chunks(events, generator.reference(dt_base), situation, aggregate, chunksize)
+    if not chunks:
+        return []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [dt_expr for dt_expr_list in executor.map(lambda args: _render_chunk_with(generator, args), chunks)
+                for dt_expr in dt_expr_list]
+
+
+def _split_chunks(events, dt_base, situation, aggregate, chunksize):
+    from itertools import islice
+
+    if situation not in (None, SCHEDULING_DIALOG, SUMMING_UP):
+        raise UndefinedSituationException("Invalid situation provided.")
+    if chunksize < 1:
+        raise ValueError("`chunksize` should be positive")
+
+    events = iter(events)
+    chunks = []
+    dt_prev = None
+    while True:
+        chunk = list(islice(events, chunksize))
+        if not chunk:
+            break
+        # A chunk carries the start of the event before it so that its first day group is not repeated.
+        chunks.append((chunk, dt_base, situation, aggregate, dt_prev))
+        dt_prev = chunk[-1][0]
+    return chunks
+
+
+_worker_generator = None
+
+
+def _init_worker(timezone):
+    global _worker_generator
+    _worker_generator = DateTimeExprGenerator(timezone)
+
+
+def _render_chunk(args):
+    return _render_chunk_with(_worker_generator, args)
+
+
+def _render_chunk_with(generator, args):
+    chunk, dt_base, situation, aggregate, dt_prev = args
+    if situation is None:
+        return list(generator.iter_list(chunk, dt_base=dt_base, aggregate=aggregate, dt_prev=dt_prev))
+    return [generator.generate(dt, dt_end, dt_base=dt_base, situation=situation) for dt, dt_end, _ in chunk]
+
+
+def _write_lines(stream, lines, buffer_lines):
+    """
+    Write lines with line breaks into a text or binary stream, `buffer_lines` lines per write. Each chunk is joined
+    and encoded at once, so a line is copied once into the chunk and once into the stream.
+    """
+    if buffer_lines < 1:
+        raise ValueError("`buffer_lines` should be positive")
+
+    # Text streams are not all `io.TextIOBase`, e.g. spooled temporary files, so binary streams are recognized
+    # by their class or mode. Codecs writers take text but pass `mode` through from the stream they wrap.
+    if isinstance(stream, (TextIOBase, StreamWriter)):
+        binary = False
+    else:
+        binary = isinstance(stream, (RawIOBase, BufferedIOBase)) or "b" in getattr(stream, "mode", "")
+    count = 0
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= buffer_lines:
+            count += len(buffer)
+            buffer.append("")
+            chunk = "\n".join(buffer)
+            stream.write(chunk.encode("utf-8") if binary else chunk)
+            buffer = []
+    if buffer:
+        count += len(buffer)
+        buffer.append("")
+        chunk = "\n".join(buffer)
+        stream.write(chunk.encode("utf-8") if binary else chunk)
+    return count
+
+
+def _from_isoformat(text):
+    """
+    Parse an ISO-8601 datetime of `datetime.isoformat()`, also with the "Z" suffix of UTC which
+    `datetime.fromisoformat()` accepts only from Python 3.11.
+    """
+    if text[-1:] in ("Z", "z"):
+        text = text[:-1] + "+00:00"
+    return datetime.fromisoformat(text)
+
+
+def _elapsed_seconds(dt, dt_ref):
+    """
+    Return seconds elapsed from `dt_ref` to `dt`. Python subtracts wall clock times when both datetimes share
+    a tzinfo, which is off by the DST change for zones like `zoneinfo.ZoneInfo`.
+    """
+    delta = (dt - dt_ref).total_seconds()
+    if dt.tzinfo is not None and dt.tzinfo is dt_ref.tzinfo:
+        delta -= (dt.utcoffset() - dt_ref.utcoffset()).total_seconds()
+    return delta
+
+
+def _first_ordinal(year):
+    """
+    Return the proleptic Gregorian ordinal of January 1 of `year`.
+    """
+    y = year - 1
+    return y * 365 + y // 4 - y // 100 + y // 400 + 1
+
+
+_TokenTables = namedtuple('_TokenTables', ['hours', 'meridiem_hours', 'minutes', 'seconds', 'clock', 'durations',
+                                           'months', 'days', 'month_days', 'weekdays', 'short_weekdays'])
+
+_TOKEN_TABLES = None
+
+_StyleTables = namedtuple('_StyleTables', ['hours', 'meridiem_hours', 'minute_seconds', 'date_end', 'day_suffixes',
+                                           'relative_day_suffixes', 'range_format'])
+
+_STYLE_TABLES = {}
+
+_HorizonTables = namedtuple('_HorizonTables', ['scheduling_dialog', 'scheduling_dialog_rules', 'summing_up',
+                                               'summing_up_rules', 'summing_up_relative',
+                                               'summing_up_relative_rules'])
+
+# The number of reference dates whose horizon tables a generator keeps
+_HORIZON_REFERENCES = 8
+
+
+def _token_tables():
+    """
+    Build tables of every token the rules emit, indexed by the field they render. Built once and shared.
+    """
+    global _TOKEN_TABLES
+    if _TOKEN_TABLES is None:
+        # Tables are assembled from small pieces by concatenation, which is much cheaper than formatting
+        # thousands of strings on the first construction.
+        numbers = [str(number) for number in range(60)]
+        padded = ["0" + number if len(number) == 1 else number for number in numbers]
+        hours = tuple(numbers[hour if 0 < hour < 13 else (12 if hour == 0 else hour - 12)] + "시" for hour in range(24))
+
+        hour_durations = [""] + [number + "시간" for number in numbers[1:24]]
+        minute_durations = [""] + [number + "분" for number in numbers[1:60]]
+        durations = tuple("(" + h + (" " if h and m else "") + m + ")"
+                          for h in hour_durations for m in minute_durations)
+
+        _TOKEN_TABLES = _TokenTables(
+            hours=hours,
+            meridiem_hours=tuple(("오전 " if hour < 12 else "오후 ") + hours[hour] for hour in range(24)),
+            minutes=tuple(" " + number + "분" for number in numbers),
+            seconds=tuple(" " + number + "초" for number in numbers),
+            clock=tuple(hour + ":" + minute for hour in padded[:24] for minute in padded),
+            durations=durations,
+            months=tuple(number + "월" for number in numbers[:13]),
+            days=tuple(number + "일" for number in numbers[:32]),
+            month_days=tuple(tuple(month + "/" + day for day in numbers[:32]) for month in numbers[:13]),
+            weekdays=WEEKDAYS,
+            short_weekdays=tuple("(" + weekday[0] + ")" for weekday in WEEKDAYS),
+        )
+    return _TOKEN_TABLES
+
+
+def _style_tables(style):
+    """
+    Compile a style into the tables the scheduling dialog rules read, so they render any style without a branch.
+    """
+    tables = _STYLE_TABLES.get(style)
+    if tables is not None:
+        return tables
+
+    if not isinstance(style, StyleProfile):
+        raise TypeError("`style` should be a `StyleProfile`")
+    if style.range_joiner not in ("부터", "~"):
+        raise ValueError("`range_joiner` should be \"부터\" or \"~\"")
+
+    tokens = _token_tables()
+    if style.hour24:
+        hours = meridiem_hours = tuple(str(hour) + "시" for hour in range(24))
+    else:
+        hours, meridiem_hours = tokens.hours, tokens.meridiem_hours
+
+    # "분" and "초" of a time, indexed by minute * 60 + second. A time with seconds shows its minutes even if 0.
+    minute_seconds = []
+    for minute in range(60):
+        for second in range(60):
+            if second > 0 and style.seconds:
+                minute_seconds.append(tokens.minutes[minute] + tokens.seconds[second])
+            elif minute > 0:
+                minute_seconds.append(tokens.minutes[minute])
+            else:
+                minute_seconds.append("")
+
+    no_suffixes = ("",) * len(tokens.days)
+    if style.day_of_month:
+        day_suffixes = tuple("(" + day + ")" for day in tokens.days)
+    else:
+        day_suffixes = no_suffixes
+
+    # A race at worst compiles a style twice.
+    tables = _STYLE_TABLES[style] = _StyleTables(
+        hours=hours,
+        meridiem_hours=meridiem_hours,
+        minute_seconds=tuple(minute_seconds),
+        date_end="," if style.date_comma else "",
+        day_suffixes=day_suffixes,
+        relative_day_suffixes={0: no_suffixes, 1: no_suffixes},
+        range_format="{}부터 {}" if style.range_joiner == "부터" else "{} ~ {}",
+    )
+    return tables
+
+
+class GeneratorStats(object):
+    """
+        Call counts and cumulative time of each phase of rendering, and counts of the date rules that fired.
+
+        Phases are "validation" (argument checks in `generate()`), "conversion" (timezone conversion),
+        "date", "time" and "datetime" (phrase builders) and "assembly" (joining phrases). Times are exclusive:
+        the time of a phase does not include the phases it calls.
+    """
+
+    PHASES = ("validation", "conversion", "date", "time", "datetime", "assembly")
+
+    def __init__(self, hook=None):
+        """
+        :param hook: A callable called with (phase, seconds) whenever a phase is recorded
+        :type hook: callable
+        """
+        self.hook = hook
+        self.__lock = Lock()
+        self.__local = local()
+        self.reset()
+
+    def reset(self):
+        with self.__lock:
+            self.calls = dict((phase, 0) for phase in self.PHASES)
+            self.seconds = dict((phase, 0.0) for phase in self.PHASES)
+            self.rules = {}
+
+    def record(self, phase, seconds):
+        with self.__lock:
+            self.calls[phase] = self.calls.get(phase, 0) + 1
+            self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+        if self.hook is not None:
+            self.hook(phase, seconds)
+
+    def count_rule(self, rule):
+        """
+        Count a date rule that fired. Date builders call it from the branch that made the phrase.
+        """
+        with self.__lock:
+            self.rules[rule] = self.rules.get(rule, 0) + 1
+
+    def timed(self, phase, func):
+        """
+        Wrap `func` to record its exclusive time under `phase`.
+        """
+        state = self.__local
+
+        def wrapper(*args, **kwargs):
+            stack = getattr(state, "stack", None)
+            if stack is None:
+                stack = state.stack = []
+            stack.append(0.0)
+            started = perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - started
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+            self.record(phase, elapsed - children)
+            return result
+
+        return wrapper
+
+    def summary(self):
+        """
+        Return a dict of phases with calls, total seconds and mean microseconds, and rule counts.
+        """
+        with self.__lock:
+            phases = dict((phase, {"calls": calls, "seconds": self.seconds[phase],
+                                   "mean_us": self.seconds[phase] / calls * 1e6 if calls else 0.0})
+                          for phase, calls in self.calls.items())
+            return {"phases": phases, "rules": dict(self.rules)}
+
+
+class _TimedConverter(TimezoneConverter):
+    """
+        A timezone converter recording its conversions under the "conversion" phase.
+    """
+
+    def __init__(self, converter, stats):
+        super(_TimedConverter, self).__init__(converter.name)
+        self.converter = converter
+        self.__to_local = stats.timed("conversion", converter.to_local)
+        self.__utc_offset = stats.timed("conversion", converter.utc_offset)
+
+    def __reduce__(self):
+        return self.converter.__reduce__()
+
+    def to_local(self, dt):
+        return self.__to_local(dt)
+
+    def utc_offset(self, timestamp):
+        return self.__utc_offset(timestamp)
+
+    def utc_offsets(self, np, timestamps):
+        return self.converter.utc_offsets(np, timestamps)
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _ExpressionCache(object):
+    """
+        A bounded mapping from normalized inputs to expressions with hit/miss counters.
+    """
+
+    def __init__(self, maxsize, policy="lru"):
+        if maxsize < 0:
+            raise ValueError("`cache_size` should not be negative")
+        if policy not in ("lru", "fifo"):
+            raise ValueError("`cache_policy` should be either \"lru\" or \"fifo\"")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.__data = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, key):
+        with self.__lock:
+            value = self.__data.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                if self.policy == "lru":
+                    self.__data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self.__lock:
+            self.__data[key] = value
+            if len(self.__data) > self.maxsize:
+                self.__data.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self.__lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self.__data))
+
+
+_MISSING = -2**63
+
+
+def _to_epoch_seconds(np, values):
+    """
+    Convert an array of `numpy.datetime64` values or POSIX timestamps into int64 seconds.
+    Missing values (NaT, NaN) are mapped to `_MISSING`.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == 'M':
+        missing = np.isnat(values)
+        seconds = values.astype('datetime64[s]').astype(np.int64)
+    elif values.dtype.kind in 'iu':
+        missing = np.zeros(values.shape, dtype=bool)
+        seconds = values.astype(np.int64)
+    elif values.dtype.kind == 'f':
+        missing = np.isnan(values)
+        seconds = np.floor(np.where(missing, 0, values)).astype(np.int64)
+    else:
+        raise TypeError("Datetimes should be given as `numpy.datetime64` values or POSIX timestamps")
+    return np.where(missing, _MISSING, seconds)
+
+
+def _local_fields(np, seconds):
+    """
+    Split local POSIX-like timestamps into (year, month, day, hour, minute, second) columns.
+    """
+    days, seconds_of_day = np.divmod(seconds, 86400)
+
+    # Civil date from days since 1970-01-01 in the proleptic Gregorian calendar.
+    z = days + 719468
+    era = np.floor_divide(z, 146097)
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+
+    hour, remainder = np.divmod(seconds_of_day, 3600)
+    minute, second = np.divmod(remainder, 60)
+    return year, month, day, hour, minute, second
+
+
+_LocalColumns = namedtuple('_LocalColumns', ['days', 'year', 'month', 'day', 'hour', 'minute', 'second',
+                                             'weekday', 'week'])
+
+
+def _local_columns(np, seconds):
+    """
+    Split an int64 array of local POSIX-like timestamps into the columns the rules read. Weekdays are 0 for Monday
+    and weeks are ISO week numbers.
+    """
+    days = seconds // 86400
+    year, month, day, hour, minute, second = _local_fields(np, seconds)
+
+    # 1970-01-01 is a Thursday, and the ISO week of a day is the week of its Thursday in the year of the Thursday.
+    weekday = (days + 3) % 7
+    thursday = days - weekday + 3
+    week = (thursday + 719163 - _first_ordinal(_local_fields(np, thursday * 86400)[0])) // 7 + 1
+    return _LocalColumns(days, year, month, day, hour, minute, second, weekday, week)
+
+
+def _to_float_seconds(np, values, rows):
+    """
+    Return POSIX timestamps of `rows` as floats, keeping the fractions `_to_epoch_seconds()` drops so that elapsed
+    times are exact.
+    """
+    values = np.asarray(values)[rows]
+    if values.dtype.kind == 'M':
+        return values.astype('datetime64[us]').astype(np.int64) / 1e6
+    return values.astype(np.float64)
+
+
+def _take(columns, rows):
+    return _LocalColumns(*(column[rows] for column in columns))
+
+
+def _import_numpy(name):
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("`{}` requires numpy. Install it with `pip install KoNLTK[batch]`.".format(name))
+    return np
+
+
+_BatchTables = namedtuple('_BatchTables', ['hours', 'meridiem_hours', 'minute_seconds', 'month_day_weekdays',
+                                           'day_weekdays', 'weekday_days', 'day_suffixes', 'relative_day_suffixes',
+                                           'range_joiner', 'short_month_day_weekdays', 'short_day_weekdays', 'clock',
+                                           'spaced_clock', 'spaced_durations'])
+
+_BATCH_TABLES = {}
+
+
+def _batch_tables(np, style):
+    """
+    Return object arrays of the phrases the column-wise rules index, built once per style. Dates are indexed by
+    (month * 32 + day) * 7 + weekday or day * 7 + weekday, and times by hour, hour * 60 + minute or
+    minute * 60 + second.
+    """
+    tables = _BATCH_TABLES.get(style)
+    if tables is not None:
+        return tables
+
+    tokens = _token_tables()
+    style_tables = _style_tables(style)
+
+    def array(phrases):
+        # `np.array()` of strings makes a fixed-width string array, so objects are copied in.
+        result = np.empty(len(phrases), dtype=object)
+        result[:] = phrases
+        return result
+
+    month_days = [(month, day) for month in range(13) for day in range(32)]
+    tables = _BATCH_TABLES[style] = _BatchTables(
+        hours=array(style_tables.hours),
+        meridiem_hours=array(style_tables.meridiem_hours),
+        minute_seconds=array(style_tables.minute_seconds),
+        month_day_weekdays=array([tokens.months[month] + " " + tokens.days[day] + " " + weekday + style_tables.date_end
+                                  for month, day in month_days for weekday in tokens.weekdays]),
+        day_weekdays=array([day + " " + weekday for day in tokens.days for weekday in tokens.weekdays]),
+        weekday_days=array([weekday + suffix for weekday in tokens.weekdays for suffix in style_tables.day_suffixes]),
+        day_suffixes=array(style_tables.day_suffixes),
+        relative_day_suffixes=dict((diff, array(suffixes))
+                                   for diff, suffixes in style_tables.relative_day_suffixes.items()),
+        range_joiner=style_tables.range_format.format("", ""),
+        short_month_day_weekdays=array([tokens.month_days[month][day] + weekday
+                                        for month, day in month_days for weekday in tokens.short_weekdays]),
+        short_day_weekdays=array([str(day) + weekday for day in range(32) for weekday in tokens.short_weekdays]),
+        clock=array(tokens.clock),
+        spaced_clock=array([" " + clock for clock in tokens.clock]),
+        spaced_durations=array([" " + duration for duration in tokens.durations]),
+    )
+    return tables
+
+
+def _year_strings(np, years):
+    if not len(years):
+        return np.empty(0, dtype=object)
+    low = int(years.min())
+    strings = np.empty(int(years.max()) - low + 1, dtype=object)
+    strings[:] = [str(year) for year in range(low, low + len(strings))]
+    return strings[years - low]
+
+
+def _batch_date_for_scheduling_dialog(np, tables, dt_base, dt, dt_ref=None):
+    """
+    `__str_date_for_scheduling_dialog()` for columns. `dt_ref` holds the columns of the starts of ranges.
+    """
+    exprs = np.empty(len(dt.days), dtype=object)
+    dt_comp = dt_base if dt_ref is None else dt_ref
+
+    with_year = (dt.year != dt_comp.year) | (dt.month < dt_comp.month)
+    absolute = with_year | (dt.month != dt_comp.month)
+    month_day_weekdays = tables.month_day_weekdays[((dt.month * 32 + dt.day) * 7 + dt.weekday)[absolute]]
+    exprs[absolute] = month_day_weekdays
+    exprs[with_year] = _year_strings(np, dt.year[with_year]) + "년 " + exprs[with_year]
+    rest = ~absolute
+
+    if dt_ref is not None:
+        same_day = rest & (dt.day == dt_ref.day)
+        exprs[same_day] = ""
+        rest &= ~same_day
+
+    day_diff = dt.day - dt_base.day
+    for diff, relative_day in dt_base.relative_days.items():
+        rows = rest & (day_diff == diff)
+        suffixes = tables.relative_day_suffixes.get(diff, tables.day_suffixes)
+        exprs[rows] = relative_day + suffixes[dt.day[rows]]
+        rest &= ~rows
+
+    if dt_ref is not None:
+        rest_weeks = rest & (dt_ref.week != dt.week)
+    else:
+        rest_weeks = rest
+    week_diff = dt.week - dt_base.week
+    weekday_days = tables.weekday_days[dt.weekday * 32 + dt.day]
+    for diff in (-1, 0, 1):
+        rows = rest_weeks & (week_diff == diff)
+        if diff == 0:
+            this_week = rows & (day_diff < 0)
+            exprs[this_week] = RELATIVE_WEEKS[0] + " " + weekday_days[this_week]
+            exprs[rows & ~this_week] = weekday_days[rows & ~this_week]
         else:
-            return weekdays[dt.weekday()]
+            exprs[rows] = RELATIVE_WEEKS[diff] + " " + weekday_days[rows]
+        rest &= ~rows
+
+    exprs[rest] = tables.day_weekdays[(dt.day * 7 + dt.weekday)[rest]]
+    return exprs
+
+
+def _batch_time_for_scheduling_dialog(np, tables, dt, dt_ref=None):
+    """
+    `__str_time_for_scheduling_dialog()` for columns.
+    """
+    minute_seconds = tables.minute_seconds[dt.minute * 60 + dt.second]
+    if dt_ref is None:
+        return tables.meridiem_hours[dt.hour] + minute_seconds
+    meridiem = (dt.days != dt_ref.days) | ((dt.hour < 12) != (dt_ref.hour < 12))
+    return np.where(meridiem, tables.meridiem_hours[dt.hour], tables.hours[dt.hour]) + minute_seconds
+
+
+def _batch_scheduling_dialog(np, tables, dt_base, dt, rows, dt_end, elapsed):
+    """
+    Expressions for a schedule dialog of columns of starts and of the ends of `rows`.
+    """
+    exprs = _batch_date_for_scheduling_dialog(np, tables, dt_base, dt) + " " + \
+        _batch_time_for_scheduling_dialog(np, tables, dt)
+    if not len(rows):
+        return exprs
 
+    dt_ref = _take(dt, rows)
+    end_exprs = _batch_time_for_scheduling_dialog(np, tables, dt_end, dt_ref)
+    dates = _batch_date_for_scheduling_dialog(np, tables, dt_base, dt_end, dt_ref)
+    dated = dates != ""
+    end_exprs[dated] = dates[dated] + " " + end_exprs[dated]
+    exprs[rows] = exprs[rows] + tables.range_joiner + end_exprs
+    return exprs
+
+
+def _batch_date_for_summing_up(np, tables, dt_base, dt):
+    """
+    `__str_date_for_summing_up()` of starts for columns, without relative days.
+    """
+    exprs = tables.short_month_day_weekdays[(dt.month * 32 + dt.day) * 7 + dt.weekday]
+    with_year = (dt.year != dt_base.year) | (dt.month < dt_base.month)
+    exprs[with_year] = _year_strings(np, dt.year[with_year]) + "/" + exprs[with_year]
+    return exprs
+
+
+def _batch_summing_up(np, tables, dt_base, dt, rows, dt_end, elapsed):
+    """
+    Expressions for a schedule summary of columns of starts and of the ends of `rows`.
+    """
+    exprs = _batch_date_for_summing_up(np, tables, dt_base, dt) + tables.spaced_clock[dt.hour * 60 + dt.minute]
+    if not len(rows):
+        return exprs
+
+    dt_ref = _take(dt, rows)
+    end_exprs = tables.clock[dt_end.hour * 60 + dt_end.minute]
+    with_year = (dt_end.year != dt_ref.year) | (dt_end.month < dt_ref.month)
+    with_month = with_year | (dt_end.month != dt_ref.month)
+    with_day = ~with_month & (dt_end.day != dt_ref.day)
+    end_exprs[with_month] = tables.short_month_day_weekdays[
+        ((dt_end.month * 32 + dt_end.day) * 7 + dt_end.weekday)[with_month]] + " " + end_exprs[with_month]
+    end_exprs[with_year] = _year_strings(np, dt_end.year[with_year]) + "/" + end_exprs[with_year]
+    end_exprs[with_day] = tables.short_day_weekdays[(dt_end.day * 7 + dt_end.weekday)[with_day]] + " " + \
+        end_exprs[with_day]
+
+    timed = (elapsed >= 59) & (elapsed < 60*60*24)
+    end_exprs[timed] = end_exprs[timed] + tables.spaced_durations[(elapsed[timed] // 60).astype(np.int64)]
+    exprs[rows] = exprs[rows] + " ~ " + end_exprs
+    return exprs
+
+
+def _batch_list(np, tables, dt_base, aggregate, notes, dt, rows, dt_end, elapsed):
+    """
+    Expressions of `generate_list()` for columns of starts sorted by start and of the ends of `rows`.
+    """
+    exprs = tables.clock[dt.hour * 60 + dt.minute]
+
+    # Without aggregation every expression has its date.
+    dated = np.ones(len(exprs), dtype=bool)
+    if aggregate:
+        dated[1:] = dt.days[1:] != dt.days[:-1]
+
+    dates = _batch_date_for_summing_up(np, tables, dt_base, _take(dt, dated))
+    if aggregate:
+        day_diff = dt.day[dated] - dt_base.day
+        for diff, relative_day in dt_base.relative_days.items():
+            relative = day_diff == diff
+            dates[relative] = dates[relative] + " " + relative_day
+        dates = dates + "\n"
+        dates[1:] = "\n" + dates[1:]
+    else:
+        dates = dates + " "
+    exprs[dated] = dates + exprs[dated]
+
+    if not len(rows):
+        return exprs
+
+    end_exprs = " ~ " + tables.clock[dt_end.hour * 60 + dt_end.minute]
+    noted = np.zeros(len(rows), dtype=bool)
+    if notes is not None:
+        row_notes = notes[rows]
+        noted = np.array([bool(note) for note in row_notes], dtype=bool)
+        end_exprs[noted] = end_exprs[noted] + np.array([" " + str(note) for note in row_notes[noted]], dtype=object)
+
+    timed = ~noted & (elapsed >= 59) & (elapsed < 60*60*24)
+    end_exprs[timed] = end_exprs[timed] + tables.spaced_durations[(elapsed[timed] // 60).astype(np.int64)]
+    exprs[rows] = exprs[rows] + end_exprs
+    return exprs
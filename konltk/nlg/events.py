@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from konltk.nlg.exceptions import DateTimeOffsetNaiveException
+
+
+"""
+An EventBlock stores a schedule compactly: starts and ends as int64 POSIX microseconds and notes as indices into
+a table of distinct notes, 20 bytes per event against 200+ bytes for a tuple of two aware datetimes and a note.
+`DateTimeExprGenerator.generate_list()` and `generate()` accept a block in place of a list of tuples.
+
+```
+block = EventBlock([(dt, dt_end, "회의"), (dt2, None, None)])
+block.append(dt3, dt3_end, "회의")
+generator.generate_list(block, dt_base=dt_base)
+```
+
+Times are kept in microseconds, the resolution of `datetime`, so durations of summaries, which come from the
+exact elapsed time, render the same as from tuples. Events are read back with POSIX timestamps in seconds.
+"""
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# An end of an event without an end
+_NO_END = -2**63
+
+
+class EventBlock(object):
+    """
+        A compact array-backed list of (start, end, note) events.
+    """
+
+    def __init__(self, events=()):
+        """
+        :param events: (start, end, note) tuples. Starts and ends may be aware datetimes or POSIX timestamps.
+        :type events: iterable((datetime.datetime, datetime.datetime, str))
+        """
+        self.starts = array('q')
+        self.ends = array('q')
+        self.note_ids = array('i')
+        self.notes = [None]
+        self.__note_ids = {None: 0}
+        self.extend(events)
+
+    def append(self, dt, dt_end=None, note=None):
+        """
+        Append an event.
+        """
+        note_id = self.__note_ids.get(note)
+        if note_id is None:
+            note_id = self.__note_ids[note] = len(self.notes)
+            self.notes.append(note)
+
+        self.starts.append(_to_microseconds(dt, "dt"))
+        self.ends.append(_NO_END if dt_end is None else _to_microseconds(dt_end, "dt_end"))
+        self.note_ids.append(note_id)
+
+    def extend(self, events):
+        for dt, dt_end, note in events:
+            self.append(dt, dt_end, note)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        us_end = self.ends[index]
+        return (self.starts[index] / 1e6, None if us_end == _NO_END else us_end / 1e6,
+                self.notes[self.note_ids[index]])
+
+    def __iter__(self):
+        notes = self.notes
+        for us, us_end, note_id in zip(self.starts, self.ends, self.note_ids):
+            yield us / 1e6, None if us_end == _NO_END else us_end / 1e6, notes[note_id]
+
+    @property
+    def nbytes(self):
+        """
+        Bytes of the arrays of events, not counting the table of distinct notes.
+        """
+        return (len(self.starts) + len(self.ends)) * self.starts.itemsize + len(self.note_ids) * self.note_ids.itemsize
+
+
+def _to_microseconds(dt, name):
+    if isinstance(dt, datetime):
+        if dt.tzinfo is None:
+            raise DateTimeOffsetNaiveException("`{}` has no tzinfo. All datetime objects should be offset-aware."
+                                               .format(name))
+        return (dt - _EPOCH) // _MICROSECOND
+    return int(round(dt * 1000000))
@@ -4,3 +4,6 @@ class DateTimeOffsetNaiveException(Exception):
 
 class UndefinedSituationException(Exception):
     pass
+
+class DateTimeExprParseException(Exception):
+    pass
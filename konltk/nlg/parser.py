@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date
+from datetime import datetime
+from datetime import time
+
+from konltk.nlg.datetime import RELATIVE_DAYS, RELATIVE_WEEKS, WEEKDAYS, LocalTime, ReferenceContext
+from konltk.nlg.exceptions import DateTimeExprParseException
+from konltk.nlg.timezones import get_converter
+
+
+"""
+A DateTimeExprParser turns expressions made by DateTimeExprGenerator back into datetimes, relative to the same
+reference time.
+
+An expression is split into tokens by a trie of the generator's own vocabulary ("내일", "다음주", "월요일", "(월)",
+"오후", "시간", ...), matching the longest word at each position, and the tokens are read by a small
+hand-written parser. There are no regular expressions.
+
+```
+from konltk.nlg.parser import DateTimeExprParser
+
+parser = DateTimeExprParser()
+dt_base = parser.tz.localize(datetime(2018, 6, 6, 15))
+
+parser.parse("내일 오후 10시 10분", dt_base=dt_base)
+# datetime(2018, 6, 7, 22, 10, tzinfo=+09:00)
+parser.parse("다음주 월요일 오전 10시부터 오후 2시", dt_base=dt_base)
+# (datetime(2018, 6, 11, 10, tzinfo=+09:00), datetime(2018, 6, 11, 14, tzinfo=+09:00))
+parser.parse("7/21(토) 15:10 ~ 16:00 (50분)", dt_base=dt_base)
+# (datetime(2018, 7, 21, 15, 10, tzinfo=+09:00), datetime(2018, 7, 21, 16, tzinfo=+09:00))
+```
+
+Like the generator, dates without a year or month take them from the reference time, or from the start for the
+end of a range, and an end without a date is on the day of the start. Hours without "오전"/"오후" are in the same
+half of the day as the start. Local times repeated or skipped by a DST change are resolved as in
+`TimezoneConverter.localize()`.
+
+Expressions are read in the default `StyleProfile` of the generator.
+"""
+
+
+# Token kinds. Punctuation and unit words are their own kinds.
+_NUMBER = "number"
+_RELATIVE_DAY = "relative_day"
+_RELATIVE_WEEK = "relative_week"
+_WEEKDAY = "weekday"
+_SHORT_WEEKDAY = "short_weekday"
+_MERIDIEM = "meridiem"
+_RANGE = "range"
+
+_END = (None, None)
+
+_TRIE = None
+
+# The maximum number of chunks between spaces whose tokens a parser keeps
+_MAX_CHUNKS = 65536
+
+
+class DateTimeExprParser(object):
+    """
+        A parser of the time expressions DateTimeExprGenerator makes.
+    """
+
+    def __init__(self, timezone="Asia/Seoul", engine="table"):
+        """
+        :param timezone: A timezone name of expressions
+        :type timezone: str
+
+        :param engine: How to convert datetimes into the timezone, as in DateTimeExprGenerator
+        :type engine: str or konltk.nlg.timezones.TimezoneConverter
+        """
+        self.timezone = timezone
+        self.converter = get_converter(timezone, engine)
+        self.__tz = None
+        self.__trie = _trie()
+        self.__chunks = {}
+
+    @property
+    def tz(self):
+        """
+        The pytz timezone of expressions, loaded on first use.
+        """
+        if self.__tz is None:
+            import pytz
+            self.__tz = pytz.timezone(self.timezone)
+        return self.__tz
+
+    def reference(self, dt_base=None):
+        """
+        Make a reference context to pass as `dt_base` when many expressions share the same reference time.
+
+        :param dt_base: A reference datetime or POSIX timestamp. If none, `datetime.now()` is used.
+        :type dt_base: datetime.datetime or int or float or ReferenceContext
+        """
+        if isinstance(dt_base, ReferenceContext):
+            if dt_base.converter == self.converter:
+                return dt_base
+            dt_base = dt_base.dt.timestamp if isinstance(dt_base.dt, LocalTime) else dt_base.dt
+        return ReferenceContext(dt_base, self.converter)
+
+    def parse(self, expr, dt_base=None):
+        """
+        Parse a date time expression in Korean.
+
+        :param expr: An expression like "내일 오후 10시 10분" or "7/21(토) 15:10 ~ 16:00"
+        :type expr: str
+
+        :param dt_base: A reference datetime, POSIX timestamp or context. If none, `datetime.now()` is used.
+        :type dt_base: datetime.datetime or int or float or ReferenceContext
+
+        :return: An aware datetime, or a (start, end) tuple of aware datetimes for a range
+        :raises DateTimeExprParseException: if `expr` is not an expression of the generator
+        """
+        dt_base = self.reference(dt_base)
+        tokens = self.__tokenize(expr)
+        # The parser looks up to 2 tokens ahead.
+        tokens.extend((_END, _END, _END))
+
+        start, i = self.__parse_point(expr, tokens, 0, dt_base)
+        if tokens[i][0] is None:
+            return self.__to_datetime(start)
+        if tokens[i][0] != _RANGE:
+            raise DateTimeExprParseException("Unexpected {!r} in {!r}".format(tokens[i][1], expr))
+
+        end, i = self.__parse_point(expr, tokens, i + 1, dt_base, start)
+        if tokens[i][0] is not None:
+            raise DateTimeExprParseException("Unexpected {!r} in {!r}".format(tokens[i][1], expr))
+        return self.__to_datetime(start), self.__to_datetime(end)
+
+    def parse_many(self, exprs, dt_base=None):
+        """
+        Parse expressions against one reference time.
+        """
+        dt_base = self.reference(dt_base)
+        return [self.parse(expr, dt_base=dt_base) for expr in exprs]
+
+    def __tokenize(self, expr):
+        """
+        Split an expression into (kind, value) tokens. No word has a space, so tokens of each chunk between spaces,
+        like "10시" or "7/21(토)", are kept and reused. Expressions are made of a few thousand such chunks.
+        """
+        tokens = []
+        chunks = self.__chunks
+        for chunk in expr.split():
+            chunk_tokens = chunks.get(chunk)
+            if chunk_tokens is None:
+                chunk_tokens = self.__tokenize_chunk(chunk, expr)
+                if len(chunks) < _MAX_CHUNKS:
+                    chunks[chunk] = chunk_tokens
+            tokens.extend(chunk_tokens)
+        return tokens
+
+    def __tokenize_chunk(self, chunk, expr):
+        """
+        Split a chunk without spaces into tokens, taking the longest word of the vocabulary at each position.
+        """
+        tokens = []
+        i = 0
+        n = len(chunk)
+        while i < n:
+            if "0" <= chunk[i] <= "9":
+                j = i + 1
+                while j < n and "0" <= chunk[j] <= "9":
+                    j += 1
+                tokens.append((_NUMBER, int(chunk[i:j])))
+                i = j
+                continue
+
+            node = self.__trie
+            token = None
+            j = i
+            while j < n:
+                node = node.get(chunk[j])
+                if node is None:
+                    break
+                j += 1
+                if "" in node:
+                    token = node[""]
+                    end = j
+            if token is None:
+                raise DateTimeExprParseException("Unknown word {!r} in {!r}".format(chunk[i:], expr))
+            tokens.append(token)
+            i = end
+        return tuple(tokens)
+
+    def __parse_point(self, expr, tokens, i, dt_base, start=None):
+        """
+        Parse a date and a time from `tokens[i]`. Return local (ordinal, hour, minute, second) and the next index.
+        """
+        ordinal = None
+        kind, value = tokens[i]
+
+        if kind == _RELATIVE_DAY or kind == _RELATIVE_WEEK or kind == _WEEKDAY:
+            # The generator compares days of month and ISO week numbers with the reference time, only for dates
+            # in the month of the reference time, or of the start for the end of a range.
+            if start is None:
+                year, month = dt_base.year, dt_base.month
+            else:
+                year, month = date.fromordinal(start[0]).timetuple()[:2]
+
+            if kind == _RELATIVE_DAY:
+                ordinal = _ordinal_in_month(year, month, dt_base.day + value)
+                if ordinal is None:
+                    ordinal = dt_base.ordinal + value
+                i += 1
+            else:
+                week = 0
+                if kind == _RELATIVE_WEEK:
+                    week = value
+                    i += 1
+                    if tokens[i][0] != _WEEKDAY:
+                        raise DateTimeExprParseException("A weekday should follow {!r} in {!r}".format(
+                            RELATIVE_WEEKS[week], expr))
+                weekday = tokens[i][1]
+                ordinal = _ordinal_in_week(year, month, dt_base.week + week, weekday)
+                if ordinal is None:
+                    ordinal = dt_base.ordinal - dt_base.dt.weekday() + week * 7 + weekday
+                i += 1
+        elif kind == _NUMBER and tokens[i + 1][0] not in ("시", ":"):
+            ordinal, i = self.__parse_date(expr, tokens, i, dt_base, start)
+
+        # "2018년 5월 30일 수요일," ends with a comma and "6/7(목) 내일", a header of lists, with a relative day.
+        if tokens[i][0] == ",":
+            i += 1
+        if ordinal is not None and tokens[i][0] == _RELATIVE_DAY:
+            i += 1
+
+        meridiem = None
+        if tokens[i][0] == _MERIDIEM:
+            meridiem = tokens[i][1]
+            i += 1
+
+        hour = minute = second = 0
+        has_time = False
+        if tokens[i][0] == _NUMBER and tokens[i + 1][0] == "시":
+            hour = tokens[i][1]
+            i += 2
+            if tokens[i][0] == _NUMBER and tokens[i + 1][0] == "분":
+                minute = tokens[i][1]
+                i += 2
+                if tokens[i][0] == _NUMBER and tokens[i + 1][0] == "초":
+                    second = tokens[i][1]
+                    i += 2
+            if meridiem is None and start is not None and 0 < hour <= 12:
+                meridiem = 12 if start[1] >= 12 else 0
+            if meridiem is not None:
+                if not 0 < hour <= 12:
+                    raise DateTimeExprParseException("Invalid hour {} in {!r}".format(hour, expr))
+                hour = hour % 12 + meridiem
+            has_time = True
+        elif meridiem is not None:
+            raise DateTimeExprParseException("An hour should follow the meridiem in {!r}".format(expr))
+        elif tokens[i][0] == _NUMBER and tokens[i + 1][0] == ":" and tokens[i + 2][0] == _NUMBER:
+            hour = tokens[i][1]
+            minute = tokens[i + 2][1]
+            i += 3
+            has_time = True
+
+        if ordinal is None and not has_time:
+            raise DateTimeExprParseException("No date or time at {!r} in {!r}".format(tokens[i][1], expr))
+        if hour > 23 or minute > 59 or second > 59:
+            raise DateTimeExprParseException("Invalid time in {!r}".format(expr))
+
+        # The duration of a summary, e.g. "(1시간 30분)", is implied by the start and the end.
+        if tokens[i][0] == "(":
+            i += 1
+            while tokens[i][0] in (_NUMBER, "시간", "분"):
+                i += 1
+            if tokens[i][0] != ")":
+                raise DateTimeExprParseException("Unclosed duration in {!r}".format(expr))
+            i += 1
+
+        if ordinal is None:
+            ordinal = dt_base.ordinal if start is None else start[0]
+        return (ordinal, hour, minute, second), i
+
+    def __parse_date(self, expr, tokens, i, dt_base, start):
+        """
+        Parse "2018년 5월 30일 수요일", "5월 30일", "30일", "2018/5/30(수)", "5/30(수)" or "30(수)".
+        """
+        numbers = [tokens[i][1]]
+        kind = tokens[i + 1][0]
+        i += 1
+        if kind == "/":
+            while tokens[i][0] == "/" and tokens[i + 1][0] == _NUMBER:
+                numbers.append(tokens[i + 1][1])
+                i += 2
+            if tokens[i][0] != _SHORT_WEEKDAY or len(numbers) > 3:
+                raise DateTimeExprParseException("Invalid date in {!r}".format(expr))
+            i += 1
+        elif kind in ("년", "월", "일"):
+            for unit in ("년", "월", "일")[("년", "월", "일").index(kind):]:
+                if tokens[i][0] != unit:
+                    raise DateTimeExprParseException("{!r} should follow {} in {!r}".format(unit, numbers[-1], expr))
+                i += 1
+                if unit != "일":
+                    if tokens[i][0] != _NUMBER:
+                        raise DateTimeExprParseException("Invalid date in {!r}".format(expr))
+                    numbers.append(tokens[i][1])
+                    i += 1
+            if tokens[i][0] == _WEEKDAY:
+                i += 1
+        elif kind == _SHORT_WEEKDAY:
+            i += 1
+        else:
+            raise DateTimeExprParseException("Unexpected number {} in {!r}".format(numbers[0], expr))
+
+        if start is None:
+            year, month = dt_base.year, dt_base.month
+        else:
+            year, month = date.fromordinal(start[0]).timetuple()[:2]
+        day = numbers[-1]
+        if len(numbers) >= 2:
+            month = numbers[-2]
+        if len(numbers) == 3:
+            year = numbers[0]
+
+        try:
+            return date(year, month, day).toordinal(), i
+        except ValueError:
+            raise DateTimeExprParseException("Invalid date {}-{}-{} in {!r}".format(year, month, day, expr))
+
+    def __to_datetime(self, point):
+        ordinal, hour, minute, second = point
+        return self.converter.localize(datetime.combine(date.fromordinal(ordinal), time(hour, minute, second)))
+
+
+def _trie():
+    """
+    Build a trie of the vocabulary of the generator. Built once and shared.
+    Each node is a dict from characters to nodes, holding its token under "".
+    """
+    global _TRIE
+    if _TRIE is None:
+        vocabulary = {word: (word, None) for word in ("년", "월", "일", "시", "시간", "분", "초", ",", "/", ":", "(", ")")}
+        vocabulary.update({word: (_RELATIVE_DAY, offset) for offset, word in RELATIVE_DAYS.items()})
+        vocabulary.update({word: (_RELATIVE_WEEK, offset) for offset, word in RELATIVE_WEEKS.items()})
+        vocabulary.update({word: (_WEEKDAY, index) for index, word in enumerate(WEEKDAYS)})
+        vocabulary.update({"(" + word[0] + ")": (_SHORT_WEEKDAY, index) for index, word in enumerate(WEEKDAYS)})
+        vocabulary.update({"오전": (_MERIDIEM, 0), "오후": (_MERIDIEM, 12), "부터": (_RANGE, None), "~": (_RANGE, None)})
+
+        trie = {}
+        for word, token in vocabulary.items():
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = token
+        _TRIE = trie
+    return _TRIE
+
+
+def _ordinal_in_month(year, month, day):
+    """
+    Return the ordinal of a day of month, or None if the month has no such day.
+    """
+    try:
+        return date(year, month, day).toordinal()
+    except ValueError:
+        return None
+
+
+def _ordinal_in_week(year, month, week, weekday):
+    """
+    Return the ordinal of the weekday of the month in the ISO week number, or None if there is none.
+    """
+    first = date(year, month, 1)
+    day = 1 + (weekday - first.weekday()) % 7
+    while True:
+        ordinal = _ordinal_in_month(year, month, day)
+        if ordinal is None:
+            return None
+        if date.fromordinal(ordinal).isocalendar()[1] == week:
+            return ordinal
+        day += 7
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date
+from datetime import datetime
+from datetime import timezone
+
+from konltk.nlg.exceptions import DateTimeOffsetNaiveException
+from konltk.nlg.timezones import get_converter
+
+
+"""
+A Recurrence is a repeating event like an RRULE of iCalendar: daily, weekly or monthly, every `interval` periods,
+optionally on some weekdays, until a count or a datetime. Occurrences are made lazily, one at a time, so a rule
+spanning years renders a window of it without expanding the rest.
+
+```
+standup = Recurrence(tz.localize(datetime(2018, 1, 1, 9)), DAILY, weekdays=(0, 1, 2, 3, 4),
+                     duration=timedelta(minutes=15), note="스탠드업")
+
+generator.iter_list(standup.between(dt_base, dt_base + timedelta(days=14)), dt_base=dt_base)
+generator.generate_list(Recurrence(dt_start, WEEKLY, count=10), dt_base=dt_base)
+```
+
+Occurrences keep the local time of `dt_start` in its timezone, so a 9시 meeting stays at 9시 across DST changes.
+Like RRULE, a monthly rule skips months without the day of `dt_start`.
+"""
+
+
+DAILY = 0
+WEEKLY = 1
+MONTHLY = 2
+
+_MAX_ORDINAL = date.max.toordinal()
+_UTC = timezone.utc
+
+
+class Recurrence(object):
+    """
+        A lazily expanded recurring event.
+    """
+
+    def __init__(self, dt_start, freq=DAILY, interval=1, count=None, until=None, weekdays=None, duration=None,
+                 note=None):
+        """
+        :param dt_start: The first occurrence. Occurrences are at its local time in its timezone.
+        :type dt_start: datetime.datetime
+
+        :param freq: `DAILY`, `WEEKLY` or `MONTHLY`
+        :type freq: int
+
+        :param interval: The number of days, weeks or months between occurrences
+        :type interval: int
+
+        :param count: The maximum number of occurrences
+        :type count: int
+
+        :param until: The last datetime an occurrence may start at
+        :type until: datetime.datetime
+
+        :param weekdays: Weekdays of occurrences, 0 for Monday to 6 for Sunday, for daily and weekly rules.
+                         If none, a weekly rule recurs on the weekday of `dt_start`.
+        :type weekdays: iterable(int)
+
+        :param duration: The duration of an occurrence. If none, occurrences have no end.
+        :type duration: datetime.timedelta
+
+        :param note: A note of every occurrence
+        :type note: str
+        """
+        if dt_start.tzinfo is None:
+            raise DateTimeOffsetNaiveException("`dt_start` has no tzinfo. All datetime objects should be offset-aware.")
+        if until is not None and until.tzinfo is None:
+            raise DateTimeOffsetNaiveException("`until` has no tzinfo. All datetime objects should be offset-aware.")
+        if freq not in (DAILY, WEEKLY, MONTHLY):
+            raise ValueError("`freq` should be one of DAILY, WEEKLY and MONTHLY")
+        if interval < 1:
+            raise ValueError("`interval` should be positive")
+        if weekdays is not None and freq == MONTHLY:
+            raise ValueError("`weekdays` are only supported by daily and weekly rules")
+
+        self.dt_start = dt_start
+        self.freq = freq
+        self.interval = interval
+        self.count = count
+        self.until = until
+        self.weekdays = None if weekdays is None else tuple(sorted(set(weekdays)))
+        self.duration = duration
+        self.note = note
+
+        # Local times of pytz timezones are converted with a precomputed table of the zone, much faster than
+        # `localize()`. The other timezones pick the offset of a local time themselves.
+        zone = getattr(dt_start.tzinfo, "zone", None)
+        self.__converter = get_converter(zone) if zone and hasattr(dt_start.tzinfo, "localize") else None
+        self.__time = dt_start.replace(tzinfo=None).time()
+        self.__start_ordinal = dt_start.toordinal()
+
+    @property
+    def bounded(self):
+        """
+        Whether the recurrence ends, by a count or a datetime.
+        """
+        return self.count is not None or self.until is not None
+
+    def __iter__(self):
+        """
+        Iterate over (start, end, note) tuples of every occurrence. Unbounded recurrences never stop.
+        """
+        return self.__occurrences()
+
+    def between(self, dt_after, dt_before):
+        """
+        Iterate over (start, end, note) tuples of the occurrences starting in [`dt_after`, `dt_before`).
+        Periods before `dt_after` are skipped without making occurrences unless the recurrence has a count.
+        """
+        if dt_after.tzinfo is None or dt_before.tzinfo is None:
+            raise DateTimeOffsetNaiveException("A window has no tzinfo. All datetime objects should be offset-aware.")
+
+        for occurrence in self.__occurrences(dt_after.astimezone(self.dt_start.tzinfo).toordinal() - 1):
+            if occurrence[0] >= dt_before:
+                return
+            if occurrence[0] >= dt_after:
+                yield occurrence
+
+    def __occurrences(self, first_ordinal=None):
+        # Occurrences before a window still count toward `count`, so they can only be skipped without one.
+        if self.count is not None:
+            first_ordinal = None
+
+        n = 0
+        for ordinal in self.__ordinals(first_ordinal):
+            if self.count is not None and n >= self.count:
+                return
+
+            local = datetime.combine(date.fromordinal(ordinal), self.__time)
+            if self.__converter is None:
+                dt = local.replace(tzinfo=self.dt_start.tzinfo)
+            else:
+                dt = self.__converter.localize(local)
+            if self.until is not None and dt > self.until:
+                return
+
+            if self.duration is None:
+                yield dt, None, self.note
+            elif self.__converter is None:
+                yield dt, (dt.astimezone(_UTC) + self.duration).astimezone(dt.tzinfo), self.note
+            else:
+                # Converted datetimes have fixed offsets, so adding the duration is exact.
+                yield dt, self.__converter.to_local(dt + self.duration), self.note
+            n += 1
+
+    def __ordinals(self, first_ordinal=None):
+        """
+        Iterate over ordinals of the days of occurrences, starting from the period of `first_ordinal`.
+        """
+        start = self.__start_ordinal
+        interval = self.interval
+        first_ordinal = start if first_ordinal is None else max(first_ordinal, start)
+
+        if self.freq == DAILY:
+            ordinal = start + -(-(first_ordinal - start) // interval) * interval
+            while ordinal <= _MAX_ORDINAL:
+                # The ordinal 1 is a Monday.
+                if self.weekdays is None or (ordinal - 1) % 7 in self.weekdays:
+                    yield ordinal
+                ordinal += interval
+
+        elif self.freq == WEEKLY:
+            weekdays = self.weekdays or ((start - 1) % 7,)
+            monday = start - (start - 1) % 7
+            monday += (first_ordinal - monday) // (7 * interval) * 7 * interval
+            while monday + 6 <= _MAX_ORDINAL:
+                for weekday in weekdays:
+                    if monday + weekday >= start:
+                        yield monday + weekday
+                monday += 7 * interval
+
+        else:
+            day = date.fromordinal(start)
+            first = date.fromordinal(first_ordinal)
+            months = day.year * 12 + day.month - 1
+            months += (first.year * 12 + first.month - 1 - months) // interval * interval
+            while months < 10000 * 12:
+                try:
+                    yield date(months // 12, months % 12 + 1, day.day).toordinal()
+                except ValueError:
+                    pass
+                months += interval
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+from konltk.nlg.datetime import DateTimeExprGenerator, SCHEDULING_DIALOG, SUMMING_UP, _from_isoformat
+from konltk.nlg.exceptions import DateTimeOffsetNaiveException, UndefinedSituationException
+
+
+"""
+A RenderServer serves a DateTimeExprGenerator over a local HTTP endpoint (TCP or Unix socket) so that services
+written in other languages can share one warm generator.
+
+Concurrent requests are coalesced into micro-batches: the first request of a batch waits at most `window`
+seconds for others, and the whole batch is rendered at once against shared reference contexts.
+
+```
+$ python -m konltk.nlg.server --port 8080
+$ curl -s localhost:8080/render -d '{"dt": "2018-06-07T22:10:00+09:00", "dt_base": "2018-06-06T15:00:00+09:00"}'
+{"expr": "내일 오후 10시 10분"}
+$ curl -s localhost:8080/stats
+{"requests": 1, "batches": 1, "mean_batch_size": 1.0, "latency_ms": {"p50": 0.2, "p90": 0.2, "p99": 0.2}}
+```
+
+POST /render takes an object or an array of objects with `dt`, `dt_end`, `dt_base` (ISO-8601 with offsets, the
+latter two optional) and `situation` ("scheduling_dialog" or "summing_up", or 0/1).
+"""
+
+
+SITUATIONS = {"scheduling_dialog": SCHEDULING_DIALOG, "summing_up": SUMMING_UP,
+              SCHEDULING_DIALOG: SCHEDULING_DIALOG, SUMMING_UP: SUMMING_UP}
+
+HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                500: "Internal Server Error"}
+
+
+class RenderServer(object):
+    """
+        A local asyncio rendering service with request micro-batching.
+    """
+
+    def __init__(self, generator=None, window=0.002, max_batch=256, latency_samples=10000):
+        """
+        :param generator: A generator to render with. If none, a generator for "Asia/Seoul" is used.
+        :type generator: DateTimeExprGenerator
+
+        :param window: Seconds the first request of a batch waits for more requests
+        :type window: float
+
+        :param max_batch: The maximum number of requests rendered in a batch
+        :type max_batch: int
+
+        :param latency_samples: The number of recent request latencies kept for percentiles
+        :type latency_samples: int
+        """
+        self.generator = generator or DateTimeExprGenerator()
+        self.window = window
+        self.max_batch = max_batch
+
+        self.requests = 0
+        self.batches = 0
+        self.__latencies = deque(maxlen=latency_samples)
+        self.__queue = None
+        self.__batcher = None
+        self.__server = None
+        self.__handlers = set()
+
+    async def start(self, host="127.0.0.1", port=8080, path=None):
+        """
+        Start serving on a TCP port, or on a Unix socket if `path` is given.
+        """
+        self.__queue = asyncio.Queue()
+        self.__batcher = asyncio.ensure_future(self.__run_batches())
+        if path:
+            self.__server = await asyncio.start_unix_server(self.__handle, path=path)
+        else:
+            self.__server = await asyncio.start_server(self.__handle, host=host, port=port)
+        return self.__server
+
+    async def close(self):
+        """
+        Stop serving, cancel the handlers of open connections and the batcher, and wait for them to finish.
+        """
+        if self.__server is not None:
+            self.__server.close()
+        tasks = list(self.__handlers)
+        if self.__batcher is not None:
+            tasks.append(self.__batcher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.__server is not None:
+            await self.__server.wait_closed()
+
+    async def render(self, request):
+        """
+        Render a request, a dict with `dt`, `dt_end`, `dt_base` and `situation`, in the next micro-batch.
+        """
+        item = _parse_request(request)
+        future = asyncio.get_running_loop().create_future()
+        await self.__queue.put((item, future, time.perf_counter()))
+        return await future
+
+    def stats(self):
+        """
+        Return request and batch counts with latency percentiles in milliseconds.
+        """
+        latencies = sorted(self.__latencies)
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            "latency_ms": {"p{}".format(p): round(_percentile(latencies, p) * 1000, 3) for p in (50, 90, 99)},
+        }
+
+    async def __run_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.__queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.__queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            self.__render_batch(batch)
+
+    def __render_batch(self, batch):
+        references = {}
+        for (dt, dt_end, dt_base, situation), future, started in batch:
+            if future.cancelled():
+                continue
+            try:
+                if dt_base not in references:
+                    references[dt_base] = self.generator.reference(dt_base)
+                future.set_result(self.generator.generate(dt, dt_end, dt_base=references[dt_base],
+                                                          situation=situation))
+            except Exception as e:
+                future.set_exception(e)
+            self.__latencies.append(time.perf_counter() - started)
+
+        self.requests += len(batch)
+        self.batches += 1
+
+    async def __handle(self, reader, writer):
+        task = asyncio.current_task()
+        self.__handlers.add(task)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                body = b""
+                if "content-length" in headers:
+                    body = await reader.readexactly(int(headers["content-length"]))
+
+                method, target = request_line.decode("latin-1").split()[:2]
+                status, payload = await self.__dispatch(method, target, body)
+
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                writer.write("HTTP/1.1 {} {}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                             "Content-Length: {}\r\n\r\n".format(status, HTTP_REASONS[status], len(data))
+                             .encode("latin-1") + data)
+                await writer.drain()
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Cancelled by `close()`. The task ends quietly, since asyncio logs a handler task that ends cancelled.
+            pass
+        finally:
+            self.__handlers.discard(task)
+            writer.close()
+
+    async def __dispatch(self, method, target, body):
+        if target == "/stats":
+            return 200, self.stats()
+        if target != "/render":
+            return 404, {"error": "Not found"}
+        if method != "POST":
+            return 405, {"error": "Use POST"}
+
+        try:
+            request = json.loads(body.decode("utf-8"))
+            if isinstance(request, list):
+                return 200, {"exprs": list(await asyncio.gather(*(self.render(r) for r in request)))}
+            return 200, {"expr": await self.render(request)}
+        except (ValueError, KeyError, TypeError, AttributeError,
+                DateTimeOffsetNaiveException, UndefinedSituationException) as e:
+            return 400, {"error": str(e) or e.__class__.__name__}
+        except Exception as e:
+            # Anything else, e.g. an OverflowError of a date at the edge of the calendar, still gets a response
+            # instead of a dropped connection.
+            return 500, {"error": str(e) or e.__class__.__name__}
+
+
+def _parse_request(request):
+    """
+    Parse a request into (dt, dt_end, dt_base, situation).
+    """
+    dt = _from_isoformat(request["dt"])
+    dt_end = _from_isoformat(request["dt_end"]) if request.get("dt_end") else None
+    dt_base = request.get("dt_base")
+    if dt_base:
+        dt_base = _from_isoformat(dt_base)
+
+    situation = request.get("situation", SCHEDULING_DIALOG)
+    if situation not in SITUATIONS:
+        raise UndefinedSituationException("Invalid situation provided.")
+    return dt, dt_end, dt_base, SITUATIONS[situation]
+
+
+def _percentile(values, p):
+    """
+    Nearest-rank percentile of sorted values.
+    """
+    if not values:
+        return 0.0
+    rank = max(int(-(-p * len(values) // 100)), 1)
+    return values[rank - 1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Korean date time expressions over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix", help="Serve on a Unix socket at this path instead of a TCP port")
+    parser.add_argument("--timezone", default="Asia/Seoul")
+    parser.add_argument("--window", type=float, default=0.002, help="Micro-batching window in seconds")
+    parser.add_argument("--max-batch", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    server = RenderServer(DateTimeExprGenerator(args.timezone), window=args.window, max_batch=args.max_batch)
+
+    async def serve():
+        srv = await server.start(host=args.host, port=args.port, path=args.unix)
+        async with srv:
+            await srv.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
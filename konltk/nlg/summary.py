@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_left
+from bisect import bisect_right
+from collections import namedtuple
+
+from konltk.nlg.datetime import DateTimeExprGenerator, _event_start
+
+
+"""
+A ListSummary keeps the expressions of `generate_list()` up to date while events are inserted, removed or moved,
+e.g. for a calendar view that shows a long summary and changes one event at a time.
+
+An expression of the list depends only on its own event and on the date of the event right before it, which
+decides whether it starts a new day group with a date header and a blank line. A change therefore re-renders
+at most the changed events and the events right after them, and returns the lines that changed.
+
+```
+summary = ListSummary(events, dt_base=dt_base)
+summary.lines  # == generate_list(sorted(events))
+summary.update(old_event, new_event)  # [LineChange(op='replace', index=3, line='...'), ...]
+```
+"""
+
+
+LineChange = namedtuple('LineChange', ['op', 'index', 'line'])
+"""
+A change of the summary. `op` is "insert", "delete" or "replace", and `index` is the index of the line in the
+summary after the changes before it are applied. `line` is the new line, or the deleted line for "delete".
+"""
+
+
+class ListSummary(object):
+    """
+        Expressions of a list of events, kept sorted by start and re-rendered incrementally.
+    """
+
+    def __init__(self, dt_range_list=(), dt_base=None, aggregate=True, generator=None):
+        """
+        :param dt_range_list: (start, end, note) tuples. Starts and ends may also be POSIX timestamps.
+        :type dt_range_list: iterable((datetime.datetime, datetime.datetime, str))
+
+        :param dt_base: A reference datetime or context, fixed for the lifetime of the summary.
+                        If none, `datetime.now()` at construction is used.
+        :type dt_base: datetime.datetime or ReferenceContext
+
+        :param generator: A generator to render with. If none, the shared generator for "Asia/Seoul" is used.
+        :type generator: DateTimeExprGenerator
+        """
+        self.generator = generator or DateTimeExprGenerator.for_timezone()
+        self.dt_base = self.generator.reference(dt_base)
+        self.aggregate = aggregate
+
+        # Sorting is stable, so events starting at the same time keep their order.
+        self.__events = sorted(dt_range_list, key=_event_start)
+        self.__keys = [_event_start(event) for event in self.__events]
+        self.__lines = list(self.generator.iter_list(self.__events, dt_base=self.dt_base, aggregate=aggregate))
+
+    @property
+    def lines(self):
+        return list(self.__lines)
+
+    @property
+    def events(self):
+        return list(self.__events)
+
+    def __len__(self):
+        return len(self.__events)
+
+    def insert(self, event):
+        """
+        Insert an event after the events starting at or before it. Return a list of `LineChange`.
+        """
+        key = _event_start(event)
+        index = bisect_right(self.__keys, key)
+        self.__events.insert(index, event)
+        self.__keys.insert(index, key)
+        self.__lines.insert(index, self.__render(index))
+
+        return [LineChange("insert", index, self.__lines[index])] + self.__rerender(index + 1)
+
+    def remove(self, event):
+        """
+        Remove an event equal to `event`. Return a list of `LineChange`.
+
+        :raises ValueError: if no event is equal to `event`
+        """
+        index = self.__index(event)
+        del self.__events[index]
+        del self.__keys[index]
+        line = self.__lines.pop(index)
+
+        return [LineChange("delete", index, line)] + self.__rerender(index)
+
+    def update(self, event, new_event):
+        """
+        Replace an event equal to `event` with `new_event`, moving it if its start changed.
+        Return a list of `LineChange`.
+
+        :raises ValueError: if no event is equal to `event`
+        """
+        index = self.__index(event)
+        key = _event_start(new_event)
+        if (index > 0 and key < self.__keys[index - 1]) or \
+                (index + 1 < len(self.__keys) and key >= self.__keys[index + 1]):
+            return self.remove(event) + self.insert(new_event)
+
+        # The event stays in place, so only its line and the line after it can change.
+        self.__events[index] = new_event
+        self.__keys[index] = key
+        changes = []
+        line = self.__render(index)
+        if line != self.__lines[index]:
+            self.__lines[index] = line
+            changes.append(LineChange("replace", index, line))
+        return changes + self.__rerender(index + 1)
+
+    def __index(self, event):
+        key = _event_start(event)
+        for index in range(bisect_left(self.__keys, key), bisect_right(self.__keys, key)):
+            if self.__events[index] == event:
+                return index
+        raise ValueError("{!r} is not in the summary".format(event))
+
+    def __render(self, index):
+        dt_prev = self.__events[index - 1][0] if index > 0 else None
+        return next(self.generator.iter_list([self.__events[index]], dt_base=self.dt_base,
+                                             aggregate=self.aggregate, dt_prev=dt_prev))
+
+    def __rerender(self, index):
+        """
+        Re-render the line at `index`, whose previous event changed. Return its change if the line changed.
+        """
+        if index >= len(self.__events):
+            return []
+
+        line = self.__render(index)
+        if line == self.__lines[index]:
+            return []
+        self.__lines[index] = line
+        return [LineChange("replace", index, line)]
+
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+from abc import ABC
+from abc import abstractmethod
+from bisect import bisect_right
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+
+"""
+Timezone converters map aware datetimes and POSIX timestamps to the local time of a single timezone.
+
+A DateTimeExprGenerator is fixed to one timezone, so instead of asking pytz to convert every datetime it converts
+through one of these engines:
+
+ * TransitionTableConverter (default): UTC offset transitions of the zone are loaded once from the pytz database.
+   An instant is mapped to a fixed-offset `datetime.timezone` by binary search, and instants after the last
+   transition (e.g. anything after 1988 in Asia/Seoul) skip the search entirely: a datetime is converted into the
+   last offset first and compared with the last transition in the same offset, which compares the fields
+   without asking the tzinfo of the datetime for its offset again.
+ * ZoneInfoConverter: the standard library `zoneinfo` implementation (Python 3.9+).
+ * PytzConverter: plain `astimezone()` with the pytz timezone, the behavior of earlier versions.
+"""
+
+
+_EPOCH = datetime(1970, 1, 1)
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SECOND = timedelta(seconds=1)
+
+
+class TimezoneConverter(ABC):
+    """
+        Converts instants into the local time of one timezone.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.name == other.name
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((type(self), self.name))
+
+    def __reduce__(self):
+        return type(self), (self.name,)
+
+    @abstractmethod
+    def to_local(self, dt):
+        """
+        Convert an aware datetime into an aware datetime in local time.
+        """
+
+    def utc_offset(self, timestamp):
+        """
+        Return the UTC offset in seconds at a POSIX timestamp.
+        """
+        return int(self.to_local(datetime.fromtimestamp(timestamp, timezone.utc)).utcoffset().total_seconds())
+
+    def localize(self, dt):
+        """
+        Make an aware datetime in local time from a naive local datetime. A local time repeated by a DST change is
+        taken at its first occurrence, and a local time skipped by it is moved forward by the change.
+        """
+        local = (dt - _EPOCH) // _SECOND
+        offset = self.utc_offset(local)
+        timestamp = local - offset
+        corrected = self.utc_offset(timestamp)
+        if corrected != offset and self.utc_offset(local - corrected) == corrected:
+            timestamp = local - corrected
+        return self.to_local(datetime.fromtimestamp(timestamp, timezone.utc)).replace(microsecond=dt.microsecond)
+
+    def utc_offsets(self, np, timestamps):
+        """
+        Return UTC offsets in seconds for an int64 array of POSIX timestamps.
+        """
+        return np.array([self.utc_offset(int(timestamp)) for timestamp in timestamps], dtype=np.int64)
+
+
+class PytzConverter(TimezoneConverter):
+    """
+        Converts with `astimezone()` and a pytz timezone.
+    """
+
+    def __init__(self, name):
+        import pytz
+
+        super(PytzConverter, self).__init__(name)
+        self.tz = pytz.timezone(name)
+
+    def to_local(self, dt):
+        return dt.astimezone(self.tz)
+
+
+class ZoneInfoConverter(TimezoneConverter):
+    """
+        Converts with `astimezone()` and a `zoneinfo.ZoneInfo` timezone.
+    """
+
+    def __init__(self, name):
+        try:
+            from zoneinfo import ZoneInfo
+        except ImportError:
+            from backports.zoneinfo import ZoneInfo
+
+        super(ZoneInfoConverter, self).__init__(name)
+        self.tz = ZoneInfo(name)
+
+    def to_local(self, dt):
+        return dt.astimezone(self.tz)
+
+
+class TransitionTableConverter(TimezoneConverter):
+    """
+        Converts with a table of UTC offset transitions precomputed from the pytz database.
+    """
+
+    def __init__(self, name):
+        super(TransitionTableConverter, self).__init__(name)
+        tz = _load_pytz_timezone(name)
+
+        if hasattr(tz, '_utc_transition_times'):
+            transitions = [int((t - _EPOCH).total_seconds()) for t in tz._utc_transition_times]
+            infos = [(int(utcoffset.total_seconds()), tzname) for utcoffset, _, tzname in tz._transition_info]
+        else:
+            transitions = [int((datetime.min - _EPOCH).total_seconds())]
+            infos = [(int(tz.utcoffset(None).total_seconds()), tz.tzname(None))]
+
+        zones = {}
+        for info in infos:
+            if info not in zones:
+                zones[info] = timezone(timedelta(seconds=info[0]), info[1])
+
+        self.transitions = transitions
+        self.offsets = [offset for offset, _ in infos]
+        self.zones = [zones[info] for info in infos]
+        self.__last_transition = transitions[-1]
+        self.__last_offset = self.offsets[-1]
+        self.__last_zone = self.zones[-1]
+        self.__fixed_zone = self.__last_zone if len(zones) == 1 else None
+        if self.__fixed_zone is None:
+            self.__last_local = (_UTC_EPOCH + timedelta(seconds=self.__last_transition)).astimezone(self.__last_zone)
+        self.__arrays = None
+
+    def to_local(self, dt):
+        if self.__fixed_zone is not None:
+            return dt.astimezone(self.__fixed_zone)
+
+        # Datetimes of the same tzinfo compare by their fields, much faster than by `timestamp()`.
+        local = dt.astimezone(self.__last_zone)
+        if local >= self.__last_local:
+            return local
+        return dt.astimezone(self.zones[max(bisect_right(self.transitions, dt.timestamp()) - 1, 0)])
+
+    def utc_offset(self, timestamp):
+        if timestamp >= self.__last_transition:
+            return self.__last_offset
+        return self.offsets[max(bisect_right(self.transitions, timestamp) - 1, 0)]
+
+    def utc_offsets(self, np, timestamps):
+        if self.__arrays is None:
+            self.__arrays = (np.array(self.transitions, dtype=np.int64), np.array(self.offsets, dtype=np.int64))
+
+        transitions, offsets = self.__arrays
+        return offsets[np.maximum(np.searchsorted(transitions, timestamps, side='right') - 1, 0)]
+
+
+def _load_pytz_timezone(name):
+    """
+    Load a pytz timezone straight from its zone file. `pytz.timezone()` first builds an index of all zone names
+    by checking hundreds of files, which dominates the cold start of a process that needs only one zone.
+    """
+    import pytz
+    from pytz.tzfile import build_tzinfo
+
+    if name.upper() == "UTC":
+        return pytz.utc
+    try:
+        with pytz.open_resource(name) as fp:
+            return build_tzinfo(name, fp)
+    except (IOError, ValueError):
+        # Not a canonical zone file name, e.g. different letter case. Let pytz resolve it or raise.
+        return pytz.timezone(name)
+
+
+ENGINES = {
+    "table": TransitionTableConverter,
+    "zoneinfo": ZoneInfoConverter,
+    "pytz": PytzConverter,
+}
+
+
+def get_converter(timezone_name, engine="table"):
+    """
+    Make a converter for a timezone.
+
+    :param engine: "table", "zoneinfo", "pytz" or a `TimezoneConverter` instance
+    :type engine: str or TimezoneConverter
+    """
+    if isinstance(engine, TimezoneConverter):
+        return engine
+    if engine not in ENGINES:
+        raise ValueError("`engine` should be one of {}".format(", ".join(sorted(ENGINES))))
+    return ENGINES[engine](timezone_name)
@@ -105,7 +105,12 @@ setup(
 
         # Specify the Python versions you support here. In particular, ensure
         # that you indicate whether you support Python 2, Python 3 or both.
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
 
         'Topic :: Scientific/Engineering',
         'Topic :: Scientific/Engineering :: Artificial Intelligence',
@@ -131,6 +136,9 @@ setup(
     #
     packages=find_packages(exclude=['contrib', 'docs', 'tests']),  # Required
 
+    # `datetime.fromisoformat()` and `asyncio.run()` of the command-line tool and the render server need 3.7.
+    python_requires='>=3.7',
+
     # This field lists other packages that your project depends on to run.
     # Any package you put here will be installed by pip when your project is
     # installed, so they must be valid existing projects.
@@ -150,7 +158,15 @@ setup(
     extras_require={  # Optional
         'deep_learning': [
             'tensorflow'
-        ]
+        ],
+        'batch': [
+            'numpy'
+        ],
+        'columnar': [
+            'numpy',
+            'pandas',
+            'pyarrow'
+        ],
     },
 
 
@@ -177,11 +193,11 @@ setup(
     #
     # For example, the following would provide a command called `sample` which
     # executes the function `main` from this package when invoked:
-#     entry_points={  # Optional
-#         'console_scripts': [
-#             'sample=sample:main',
-#         ],
-#     },
+    entry_points={  # Optional
+        'console_scripts': [
+            'konltk-datetime=konltk.nlg.cli:main',
+        ],
+    },
 
     # List additional URLs that are relevant to your project as a dict.
     #
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+import pytest
+import pytz
+
+
+# (day, hour, note) of two hour events in June 2018 around the reference time of the tests, 2018-06-06 15:00
+EVENT_SLOTS = [(6, 15, None), (6, 18, "회의"), (7, 10, None), (8, 11, None), (8, 13, None), (9, 15, None),
+               (9, 17, "회의")]
+
+
+@pytest.fixture
+def dt_range_list():
+    """
+    (start, end, note) tuples of the events in `EVENT_SLOTS` in Asia/Seoul, sorted by start.
+    """
+    tz = pytz.timezone("Asia/Seoul")
+    return [(tz.localize(datetime(2018, 6, day, hour)), tz.localize(datetime(2018, 6, day, hour + 2)), note)
+            for day, hour, note in EVENT_SLOTS]
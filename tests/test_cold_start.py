@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import subprocess
+import sys
+
+
+COLD_START = """
+import json, sys, time
+started = time.perf_counter()
+import konltk.nlg.datetime
+imported = time.perf_counter()
+loaded = sorted(name for name in ("pytz", "numpy", "asyncio", "concurrent.futures") if name in sys.modules)
+
+from datetime import datetime, timezone
+generator = konltk.nlg.datetime.DateTimeExprGenerator.for_timezone("Asia/Seoul")
+expr = generator.generate(datetime(2018, 6, 7, 13, 10, tzinfo=timezone.utc),
+                          dt_base=datetime(2018, 6, 6, 6, tzinfo=timezone.utc))
+generated = time.perf_counter()
+
+print(json.dumps({"import": imported - started, "first_call": generated - imported, "loaded": loaded,
+                  "expr": expr, "shared": generator is konltk.nlg.datetime.DateTimeExprGenerator.for_timezone(),
+                  "tz_loaded": generator._DateTimeExprGenerator__tz is not None}))
+"""
+
+
+def test_datetime_module_should_import_and_render_quickly():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    output = subprocess.check_output([sys.executable, "-c", COLD_START], env=env, cwd=root)
+    result = json.loads(output.decode("utf-8"))
+
+    assert result["loaded"] == []
+    assert result["expr"] == "내일 오후 10시 10분"
+    assert result["shared"]
+    # Rendering never reads `tz`, so the shared generator does not load it.
+    assert not result["tz_loaded"]
+    # Generous bounds that only catch heavy imports or zone database scans sneaking back in.
+    assert result["import"] < 0.5
+    assert result["first_call"] < 0.5
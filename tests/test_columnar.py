@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import pytest
+
+from konltk.nlg.datetime import DateTimeExprGenerator, SUMMING_UP
+from konltk.nlg.exceptions import DateTimeOffsetNaiveException
+
+pd = pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+
+from konltk.nlg.columnar import generate_column, generate_list_column
+
+
+def test_columnar_should_render_pandas_and_arrow_columns(dt_range_list):
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    expr_list = [dt_expr_generator.generate(dt, dt_end, dt_base=dt_base, situation=SUMMING_UP)
+                 for dt, dt_end, _ in dt_range_list]
+    list_expr_list = dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base)
+
+    df = pd.DataFrame({
+        "start": pd.to_datetime([dt.isoformat() for dt, _, _ in dt_range_list]).tz_convert("UTC"),
+        "end": pd.to_datetime([dt_end.isoformat() for _, dt_end, _ in dt_range_list]).tz_convert("Asia/Seoul"),
+        "note": [note for _, _, note in dt_range_list],
+    }, index=range(10, 17))
+
+    exprs = generate_column(df["start"], df["end"], dt_base=dt_base, situation=SUMMING_UP)
+    assert list(exprs.index) == list(range(10, 17))
+    assert exprs.tolist() == expr_list
+    assert generate_column(pd.DatetimeIndex(df["start"]), dt_base=dt_base).tolist() == \
+        [dt_expr_generator.generate(dt, dt_base=dt_base) for dt, _, _ in dt_range_list]
+    assert generate_list_column(df["start"], df["end"], df["note"], dt_base=dt_base).tolist() == list_expr_list
+
+    table = pa.Table.from_pandas(df)
+    exprs = generate_column(table.column("start"), table.column("end"), dt_base=dt_base, situation=SUMMING_UP)
+    assert exprs.type == pa.string()
+    assert exprs.to_pylist() == expr_list
+    assert generate_list_column(table.column("start"), table.column("end"), table.column("note"),
+                                dt_base=dt_base).to_pylist() == list_expr_list
+
+    with pytest.raises(DateTimeOffsetNaiveException):
+        generate_column(df["start"].dt.tz_localize(None), dt_base=dt_base)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+import io
+
+from konltk.nlg.cli import main
+
+
+def test_cli_should_render_jsonl_records():
+    stdin = io.StringIO('{"dt": "2018-06-07T22:10:00+09:00"}\n'
+                        '\n'
+                        '{"dt": "2018-06-04T10:00:00+09:00", "dt_end": "2018-06-04T14:00:00+09:00"}\n')
+    stdout = io.StringIO()
+    main(["--dt-base", "2018-06-06T15:00:00+09:00"], stdin=stdin, stdout=stdout)
+    assert stdout.getvalue() == "내일 오후 10시 10분\n이번주 월요일 오전 10시부터 오후 2시\n"
+
+
+def test_cli_should_render_csv_records_as_list():
+    stdin = io.StringIO('dt,dt_end,note\n'
+                        '2018-06-06T15:00:00+09:00,2018-06-06T16:00:00+09:00,정보1\n'
+                        '2018-06-06T18:00:00+09:00,2018-06-06T20:00:00+09:00,\n'
+                        '2018-06-07T10:00:00+09:00,2018-06-07T12:00:00+09:00,정보3\n')
+    stdout = io.StringIO()
+    main(["--list", "--format", "csv", "--dt-base", "2018-06-06T15:00:00+09:00"], stdin=stdin, stdout=stdout)
+    assert stdout.getvalue() == '6/6(수) 오늘\n'\
+                                '15:00 ~ 16:00 정보1\n'\
+                                '18:00 ~ 20:00 (2시간)\n'\
+                                '\n'\
+                                '6/7(목) 내일\n'\
+                                '10:00 ~ 12:00 정보3\n'
+
+
+def test_cli_should_read_utc_suffix():
+    stdin = io.StringIO('{"dt": "2018-06-07T13:10:00Z"}\n')
+    stdout = io.StringIO()
+    main(["--dt-base", "2018-06-06T06:00:00Z"], stdin=stdin, stdout=stdout)
+    assert stdout.getvalue() == "내일 오후 10시 10분\n"
@@ -1,9 +1,17 @@
 # -*- coding: utf-8 -*-
 
 from datetime import datetime
-from konltk.nlg.datetime import DateTimeExprGenerator, SCHEDULING_DIALOG, SUMMING_UP
-
+from datetime import timedelta
+from konltk.nlg.datetime import DateTimeExprGenerator, GeneratorStats, StyleProfile
+from konltk.nlg.datetime import SCHEDULING_DIALOG, SUMMING_UP
+from konltk.nlg.datetime import render_by_timezone, render_parallel, render_threaded
+from konltk.nlg.events import EventBlock
+from konltk.nlg.timezones import TimezoneConverter, get_converter
+
+import codecs
+import pytest
 import pytz
+import tempfile
 
 def test_datetime_expr_generator_should_make_proper_expressions():
     dt_expr_generator = DateTimeExprGenerator()
@@ -349,3 +357,414 @@ def test_datetime_expr_generator_should_make_proper_list_expressions():
                    '6/9(토) 15:00 ~ 16:00 (1시간)\n'\
                    '6/9(토) 17:00 ~ 20:00 (3시간)'
 
+
+def test_datetime_expr_generator_should_make_same_expressions_in_batch():
+    np = pytest.importorskip('numpy')
+
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    dt_range_list = [
+        (datetime(2018, 6, 4, 10), datetime(2018, 6, 4, 14)),
+        (datetime(2018, 6, 7, 22, 10), datetime(2018, 6, 8, 22, 10)),
+        (datetime(2018, 5, 30, 8, 21), datetime(2018, 5, 31, 8, 20)),
+        (datetime(2018, 7, 21, 15, 10, 30), None),
+        (datetime(2019, 2, 4, 16), datetime(2018, 6, 6, 10)),
+        (datetime(2018, 6, 4, 10), datetime(2018, 6, 4, 14)),
+        (datetime(2018, 6, 1, 9), datetime(2018, 6, 3, 9, 0, 30)),
+        (datetime(2018, 6, 11, 9), datetime(2018, 6, 12, 9)),
+        (datetime(2018, 6, 20, 9), datetime(2018, 6, 20, 9, 0, 59)),
+        (datetime(2017, 12, 31, 23), datetime(2018, 1, 1, 1)),
+    ]
+    dt_range_list = [(tz.localize(dt), tz.localize(dt_end) if dt_end else None) for dt, dt_end in dt_range_list]
+
+    dts = np.array([dt.astimezone(pytz.UTC).replace(tzinfo=None) for dt, _ in dt_range_list], dtype='datetime64[s]')
+    dt_ends = np.array([dt_end.timestamp() if dt_end else np.nan for _, dt_end in dt_range_list])
+
+    for situation in (SCHEDULING_DIALOG, SUMMING_UP):
+        expr_list = dt_expr_generator.generate_batch(dts, dt_ends, dt_base=dt_base, situation=situation)
+        assert expr_list == [dt_expr_generator.generate(dt, dt_end, dt_base=dt_base, situation=situation)
+                             for dt, dt_end in dt_range_list]
+
+    styled_generator = DateTimeExprGenerator(style=StyleProfile(hour24=True, day_of_month=True, range_joiner="~"))
+    assert styled_generator.generate_batch(dts, dt_ends, dt_base=dt_base) == \
+        [styled_generator.generate(dt, dt_end, dt_base=dt_base) for dt, dt_end in dt_range_list]
+
+def test_datetime_expr_generator_should_make_same_list_in_batch():
+    np = pytest.importorskip('numpy')
+
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    dt_range_list = [
+        (tz.localize(datetime(2018, 6, 5, 10)), tz.localize(datetime(2018, 6, 5, 11, 30)), None),
+        (tz.localize(datetime(2018, 6, 5, 13)), None, "점심"),
+        (tz.localize(datetime(2018, 6, 6, 15)), tz.localize(datetime(2018, 6, 6, 17)), "회의"),
+        (tz.localize(datetime(2018, 6, 9, 10)), tz.localize(datetime(2018, 6, 9, 10, 30)), ""),
+        (tz.localize(datetime(2019, 1, 2, 10)), tz.localize(datetime(2019, 1, 3, 10)), None),
+    ]
+
+    dts = np.array([dt.timestamp() for dt, _, _ in dt_range_list])
+    dt_ends = np.array([dt_end.timestamp() if dt_end else np.nan for _, dt_end, _ in dt_range_list])
+    notes = [note for _, _, note in dt_range_list]
+
+    for aggregate in (True, False):
+        assert dt_expr_generator.generate_list_batch(dts, dt_ends, notes, dt_base=dt_base, aggregate=aggregate) == \
+            dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base, aggregate=aggregate)
+
+def test_datetime_expr_generator_should_reuse_cached_expressions():
+    dt_expr_generator = DateTimeExprGenerator(cache_size=2)
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    dt = tz.localize(datetime(2018, 6, 7, 15))
+
+    assert dt_expr_generator.generate(dt, dt_base=dt_base) == "내일 오후 3시"
+    assert dt_expr_generator.generate(dt, dt_base=tz.localize(datetime(2018, 6, 6, 9))) == "내일 오후 3시"
+    assert dt_expr_generator.generate(dt.astimezone(pytz.UTC), dt_base=dt_base) == "내일 오후 3시"
+    assert dt_expr_generator.cache_info() == (2, 1, 2, 1)
+
+    dt_end = tz.localize(datetime(2018, 6, 7, 16, 30))
+    assert dt_expr_generator.generate(dt, dt_end, dt_base=dt_base, situation=SUMMING_UP) == "6/7(목) 15:00 ~ 16:30 (1시간 30분)"
+    assert dt_expr_generator.generate(dt, dt_base=tz.localize(datetime(2018, 6, 7, 9))) == "오늘 오후 3시"
+    assert dt_expr_generator.cache_info() == (2, 3, 2, 2)
+
+    dt_expr_generator.cache_clear()
+    assert dt_expr_generator.cache_info() == (0, 0, 2, 0)
+
+    # Summaries of a single datetime are not cached.
+    assert dt_expr_generator.generate(dt, dt_base=dt_base, situation=SUMMING_UP) == "6/7(목) 15:00"
+    assert dt_expr_generator.cache_info() == (0, 0, 2, 0)
+
+    # Elapsed times with the same local seconds may differ by microseconds.
+    dt = tz.localize(datetime(2018, 6, 7, 15, 0, 0, 500000))
+    dt_end = tz.localize(datetime(2018, 6, 7, 15, 0, 59, 400000))
+    assert dt_expr_generator.generate(dt, dt_end, dt_base=dt_base, situation=SUMMING_UP) == "6/7(목) 15:00 ~ 15:00"
+    assert dt_expr_generator.generate(dt.replace(microsecond=0), dt_end.replace(microsecond=0), dt_base=dt_base,
+                                      situation=SUMMING_UP) == "6/7(목) 15:00 ~ 15:00 ()"
+
+def test_datetime_expr_generator_should_accept_reference_context():
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = dt_expr_generator.reference(pytz.UTC.localize(datetime(2018, 6, 6, 6)))
+    assert (dt_base.year, dt_base.month, dt_base.day, dt_base.week) == (2018, 6, 6, 23)
+    assert dt_expr_generator.reference(dt_base) is dt_base
+
+    dt = tz.localize(datetime(2018, 6, 11, 12))
+    assert dt_expr_generator.generate(dt, dt_base=dt_base) == "다음주 월요일 오후 12시"
+
+    dt_range_list = [(tz.localize(datetime(2018, 6, 7, 10)), tz.localize(datetime(2018, 6, 7, 12)), None)]
+    assert dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base) == ['6/7(목) 내일\n10:00 ~ 12:00 (2시간)']
+
+    dt_expr_generator = DateTimeExprGenerator('UTC')
+    assert dt_expr_generator.reference(dt_base).dt.hour == 6
+
+def test_datetime_expr_generator_should_iterate_list_expressions_lazily(dt_range_list):
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+
+    def dt_range_iter():
+        for dt_range in dt_range_list:
+            yield dt_range
+
+    for aggregate in (True, False):
+        expr_iter = dt_expr_generator.iter_list(dt_range_iter(), dt_base=dt_base, aggregate=aggregate)
+        assert next(expr_iter) == ('6/6(수) 오늘\n15:00 ~ 17:00 (2시간)' if aggregate else '6/6(수) 15:00 ~ 17:00 (2시간)')
+        assert [next(expr_iter)] + list(expr_iter) == \
+            dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base, aggregate=aggregate)[1:]
+
+def test_datetime_expr_generator_should_render_in_parallel(dt_range_list):
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+
+    for aggregate in (True, False):
+        expr_list = render_parallel(dt_range_list, dt_base=dt_base, aggregate=aggregate, workers=2, chunksize=2)
+        assert expr_list == dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base, aggregate=aggregate)
+
+    expr_list = render_parallel(dt_range_list, dt_base=dt_base, situation=SUMMING_UP, workers=2, chunksize=3)
+    assert expr_list == [dt_expr_generator.generate(dt, dt_end, dt_base=dt_base, situation=SUMMING_UP)
+                         for dt, dt_end, _ in dt_range_list]
+
+def test_datetime_expr_generator_should_make_same_expressions_with_any_engine():
+    tz = pytz.timezone('America/New_York')
+
+    dt_base = tz.localize(datetime(2018, 11, 1, 15))
+    dt_start = tz.localize(datetime(2018, 11, 3, 22))
+    dt_end = tz.localize(datetime(2018, 11, 4, 10))
+
+    for engine in ('table', 'zoneinfo', 'pytz'):
+        dt_expr_generator = DateTimeExprGenerator('America/New_York', engine=engine)
+        expr = dt_expr_generator.generate(dt_start, dt_end, dt_base=dt_base, situation=SUMMING_UP)
+        assert expr == "11/3(토) 22:00 ~ 4(일) 10:00 (13시간)"
+        expr = dt_expr_generator.generate(dt_start.astimezone(pytz.UTC), dt_base=dt_base)
+        assert expr == "모레 오후 10시"
+
+
+def test_transition_table_converter_should_convert_around_last_transition():
+    seoul = pytz.timezone('Asia/Seoul')
+    converter = get_converter('Asia/Seoul')
+
+    # The last DST of Asia/Seoul ended on 1988-10-09 03:00 KDT.
+    last_transition = datetime(1988, 10, 8, 18, tzinfo=pytz.UTC)
+    for seconds in (-3600, -1, 0, 1, 3600):
+        dt = last_transition + timedelta(seconds=seconds)
+        for aware in (dt, dt.astimezone(seoul)):
+            local = converter.to_local(aware)
+            assert local.replace(tzinfo=None) == dt.astimezone(seoul).replace(tzinfo=None)
+            assert local.utcoffset() == dt.astimezone(seoul).utcoffset()
+
+    with pytest.raises(TypeError):
+        TimezoneConverter('Asia/Seoul')
+
+def test_datetime_expr_generator_should_make_proper_expressions_from_timestamps():
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    ts_base = tz.localize(datetime(2018, 6, 6, 15)).timestamp()
+    ts = tz.localize(datetime(2018, 6, 7, 22, 10)).timestamp()
+    ts_end = tz.localize(datetime(2018, 6, 8, 22, 10)).timestamp()
+
+    assert dt_expr_generator.generate_timestamp(ts, ts_base=ts_base) == "내일 오후 10시 10분"
+    assert dt_expr_generator.generate_timestamp(int(ts), int(ts_end), ts_base=int(ts_base)) == \
+        "내일 오후 10시 10분부터 모레 오후 10시 10분"
+    assert dt_expr_generator.generate_timestamps([ts, ts_end], [ts + 3600, None], ts_base=ts_base,
+                                                 situation=SUMMING_UP) == ["6/7(목) 22:10 ~ 23:10 (1시간)", "6/8(금) 22:10"]
+
+    expr_list = dt_expr_generator.generate_list([(ts, ts + 3600, None), (ts_end, ts_end + 60, '정보')], dt_base=ts_base)
+    assert expr_list == ['6/7(목) 내일\n22:10 ~ 23:10 (1시간)', '\n6/8(금) 모레\n22:10 ~ 22:11 정보']
+
+def test_datetime_expr_generator_should_accept_numpy_timestamps():
+    np = pytest.importorskip('numpy')
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    ts_base = np.int64(tz.localize(datetime(2018, 6, 6, 15)).timestamp())
+    dt = tz.localize(datetime(2018, 6, 7, 22, 10))
+    assert dt_expr_generator.generate(dt, dt_base=ts_base) == "내일 오후 10시 10분"
+
+    expr_list = dt_expr_generator.generate_list([(dt, None, None)], dt_base=ts_base)
+    assert list(dt_expr_generator.iter_list([(dt, None, None)], dt_base=ts_base, dt_prev=ts_base)) == \
+        ['\n' + expr_list[0]]
+
+def test_datetime_expr_generator_should_record_stats():
+    recorded = []
+    stats = GeneratorStats(hook=lambda phase, seconds: recorded.append(phase))
+    dt_expr_generator = DateTimeExprGenerator(stats=stats)
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    for dt in [datetime(2018, 6, 7, 22, 10), datetime(2018, 6, 11, 12), datetime(2018, 5, 30, 8, 21)]:
+        dt_expr_generator.generate(tz.localize(dt), dt_base=dt_base)
+    dt_expr_generator.generate(tz.localize(datetime(2018, 6, 4, 10)), tz.localize(datetime(2018, 6, 4, 14)),
+                               dt_base=dt_base, situation=SUMMING_UP)
+
+    summary = stats.summary()
+    assert summary["phases"]["validation"]["calls"] == 4
+    assert summary["phases"]["conversion"]["calls"] == 9
+    assert summary["phases"]["date"]["calls"] == 3
+    assert summary["phases"]["datetime"]["calls"] == 2
+    assert summary["rules"] == {"relative_day": 1, "relative_week": 1, "absolute_date": 1,
+                                "month_day": 1, "same_day": 1}
+    assert recorded.count("assembly") == 4
+    assert all(phase["seconds"] >= 0 for phase in summary["phases"].values())
+
+    assert "generate" not in vars(DateTimeExprGenerator())
+
+    # Rules are recorded by the branch that fired, also for list headers and phrases of the horizon.
+    for horizon in (0, 30):
+        stats = GeneratorStats()
+        dt_expr_generator = DateTimeExprGenerator(stats=stats, horizon=horizon)
+        dt_expr_generator.generate_list([(tz.localize(datetime(2018, 6, day, 10)), None, None) for day in (7, 8, 11)],
+                                        dt_base=dt_base)
+        assert stats.summary()["rules"] == {"relative_day": 2, "month_day": 1}
+
+def test_datetime_expr_generator_should_share_generators_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        generators = list(executor.map(DateTimeExprGenerator.for_timezone, ['Asia/Seoul', 'UTC'] * 16))
+    assert all(generator is generators[0] for generator in generators[::2])
+    assert all(generator is generators[1] for generator in generators[1::2])
+
+    dt_base = pytz.UTC.localize(datetime(2018, 6, 6, 6))
+    dt = pytz.UTC.localize(datetime(2018, 6, 6, 20))
+    items = [('Asia/Seoul', dt, None), ('UTC', dt, None), ('Asia/Seoul', dt.timestamp(), dt.timestamp() + 3600)]
+    assert render_by_timezone(items, dt_base=dt_base) == ["내일 오전 5시", "오늘 오후 8시", "내일 오전 5시부터 6시"]
+
+
+def test_datetime_expr_generator_should_render_in_threads(dt_range_list):
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    dt_range_list = dt_range_list * 50
+
+    for aggregate in (True, False):
+        expr_list = render_threaded(dt_range_list, dt_base=dt_base, aggregate=aggregate, workers=4, chunksize=3)
+        assert expr_list == dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base, aggregate=aggregate)
+
+    expr_list = render_threaded(dt_range_list, dt_base=dt_base, situation=SUMMING_UP, workers=4, chunksize=7)
+    assert expr_list == [dt_expr_generator.generate(dt, dt_end, dt_base=dt_base, situation=SUMMING_UP)
+                         for dt, dt_end, _ in dt_range_list]
+
+
+def test_datetime_expr_generator_should_make_same_expressions_with_horizon():
+    dt_expr_generator = DateTimeExprGenerator()
+    horizon_generator = DateTimeExprGenerator(horizon=30)
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    dt_list = [dt_base + timedelta(days=days, hours=hours) for days in range(-45, 45, 4) for hours in (-20, 0, 7)]
+    for situation in (SCHEDULING_DIALOG, SUMMING_UP):
+        for dt in dt_list:
+            assert horizon_generator.generate(dt, dt + timedelta(hours=26), dt_base=dt_base, situation=situation) == \
+                dt_expr_generator.generate(dt, dt + timedelta(hours=26), dt_base=dt_base, situation=situation)
+
+    dt_range_list = [(dt, dt + timedelta(hours=1), None) for dt in dt_list]
+    for aggregate in (True, False):
+        assert horizon_generator.generate_list(dt_range_list, dt_base=dt_base, aggregate=aggregate) == \
+            dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base, aggregate=aggregate)
+
+
+def test_datetime_expr_generator_should_write_expressions_into_streams(dt_range_list):
+    import io
+
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    expr_list = dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base)
+
+    text_stream = io.StringIO()
+    assert dt_expr_generator.write_list(text_stream, dt_range_list, dt_base=dt_base, buffer_lines=3) == 7
+    assert text_stream.getvalue() == "".join(expr + "\n" for expr in expr_list)
+
+    binary_stream = io.BytesIO()
+    assert dt_expr_generator.write_list(binary_stream, iter(dt_range_list), dt_base=dt_base) == 7
+    assert binary_stream.getvalue() == text_stream.getvalue().encode("utf-8")
+
+    binary_stream = io.BytesIO()
+    items = [(dt.timestamp(), dt_end.timestamp(), note) for dt, dt_end, note in dt_range_list]
+    assert dt_expr_generator.generate_into(binary_stream, items, dt_base=dt_base, situation=SUMMING_UP) == 7
+    assert binary_stream.getvalue().decode("utf-8").split("\n")[:-1] == \
+        [dt_expr_generator.generate(dt, dt_end, dt_base=dt_base, situation=SUMMING_UP) for dt, dt_end, _ in dt_range_list]
+
+    # Text streams which are not `io.TextIOBase`
+    for mode in ("w+", "w+b"):
+        with tempfile.SpooledTemporaryFile(mode=mode) as spooled:
+            dt_expr_generator.write_list(spooled, dt_range_list, dt_base=dt_base)
+            spooled.seek(0)
+            expected = text_stream.getvalue()
+            assert spooled.read() == (expected if mode == "w+" else expected.encode("utf-8"))
+
+    binary_stream = io.BytesIO()
+    dt_expr_generator.write_list(codecs.getwriter("utf-8")(binary_stream), dt_range_list, dt_base=dt_base)
+    assert binary_stream.getvalue() == text_stream.getvalue().encode("utf-8")
+
+
+def test_datetime_expr_generator_should_accept_event_blocks(dt_range_list):
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    dt_range_list[-1] = (dt_range_list[-1][0], None, None)
+
+    block = EventBlock(dt_range_list)
+    assert len(block) == 7
+    assert block.notes == [None, "회의"]
+    assert block[1] == (dt_range_list[1][0].timestamp(), dt_range_list[1][1].timestamp(), "회의")
+    assert block[6][1] is None
+
+    for aggregate in (True, False):
+        assert dt_expr_generator.generate_list(block, dt_base=dt_base, aggregate=aggregate) == \
+            dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base, aggregate=aggregate)
+    for situation in (SCHEDULING_DIALOG, SUMMING_UP):
+        assert dt_expr_generator.generate(block, dt_base=dt_base, situation=situation) == \
+            [dt_expr_generator.generate(dt, dt_end, dt_base=dt_base, situation=situation)
+             for dt, dt_end, _ in dt_range_list]
+
+    # Durations come from the exact elapsed time, so fractions of a second are kept.
+    dt = tz.localize(datetime(2018, 6, 7, 10, 0, 0, 600000))
+    dt_range_list = [(dt, dt + timedelta(seconds=3599, microseconds=900000), None)]
+    assert dt_expr_generator.generate_list(EventBlock(dt_range_list), dt_base=dt_base) == \
+        dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base) == ['6/7(목) 내일\n10:00 ~ 11:00 (59분)']
+    assert dt_expr_generator.generate(EventBlock(dt_range_list), dt_base=dt_base, situation=SUMMING_UP) == \
+        ['6/7(목) 10:00 ~ 11:00 (59분)']
+
+
+def test_datetime_expr_generator_should_merge_sorted_sources(dt_range_list):
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    expr_list = dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base)
+
+    sources = [dt_range_list[::3], EventBlock(dt_range_list[1::3]), dt_range_list[2::3]]
+    assert dt_expr_generator.generate_list(sources, dt_base=dt_base, merge=True) == expr_list
+
+    shuffled = dt_range_list[::-2] + dt_range_list[-2::-2]
+    assert dt_expr_generator.generate_list(shuffled, dt_base=dt_base, sort=True) == expr_list
+    assert dt_expr_generator.generate_list([shuffled[:4], shuffled[4:]], dt_base=dt_base, sort=True, merge=True) == \
+        expr_list
+
+
+def test_datetime_expr_generator_should_read_now_from_its_clock():
+    tz = pytz.timezone("Asia/Seoul")
+    now = [tz.localize(datetime(2018, 6, 6, 23, 59, 50)).timestamp()]
+    dt_expr_generator = DateTimeExprGenerator(clock=lambda: now[0])
+
+    dt = tz.localize(datetime(2018, 6, 7, 10))
+    reference = dt_expr_generator.reference()
+    assert dt_expr_generator.generate(dt) == "내일 오전 10시"
+
+    now[0] += 9
+    assert dt_expr_generator.reference() is reference
+    assert dt_expr_generator.generate(dt) == "내일 오전 10시"
+
+    # 오늘 and the week change exactly at local midnight.
+    now[0] += 1
+    assert dt_expr_generator.reference() is not reference
+    assert dt_expr_generator.generate(dt) == "오늘 오전 10시"
+
+    now[0] = tz.localize(datetime(2018, 6, 10, 23, 59, 59)).timestamp()
+    assert dt_expr_generator.generate(tz.localize(datetime(2018, 6, 15, 10))) == "다음주 금요일 오전 10시"
+    now[0] += 1
+    assert dt_expr_generator.generate(tz.localize(datetime(2018, 6, 15, 10))) == "금요일 오전 10시"
+
+
+def test_datetime_expr_generator_should_render_styles():
+    sms = StyleProfile(hour24=True, day_of_month=True, date_comma=False, seconds=False, range_joiner="~")
+    for horizon in (0, 30):
+        dt_expr_generator = DateTimeExprGenerator(style=sms, horizon=horizon)
+        tz = dt_expr_generator.tz
+
+        dt_base = tz.localize(datetime(2018, 6, 6, 15))
+        for args, expr in [((2018, 6, 4, 10), "이번주 월요일(4일) 10시"),
+                           ((2018, 6, 5, 18), "어제(5일) 18시"),
+                           ((2018, 6, 6, 15, 0, 30), "오늘 15시"),
+                           ((2018, 6, 7, 22, 10), "내일 22시 10분"),
+                           ((2018, 6, 8, 23), "모레(8일) 23시"),
+                           ((2018, 6, 11, 0), "다음주 월요일(11일) 0시"),
+                           ((2018, 7, 21, 15, 10, 30), "7월 21일 토요일 15시 10분"),
+                           ((2019, 1, 21, 15, 0, 10), "2019년 1월 21일 월요일 15시")]:
+            assert dt_expr_generator.generate(tz.localize(datetime(*args)), dt_base=dt_base) == expr
+
+        dt = tz.localize(datetime(2018, 6, 6, 8))
+        assert dt_expr_generator.generate(dt, tz.localize(datetime(2018, 6, 6, 10)), dt_base=dt_base) == \
+            "오늘 8시 ~ 10시"
+        assert dt_expr_generator.generate(dt, tz.localize(datetime(2018, 6, 8, 10)), dt_base=dt_base) == \
+            "오늘 8시 ~ 모레(8일) 10시"
+
+        # Summaries are the same in every style.
+        assert dt_expr_generator.generate(dt, dt_base=dt_base, situation=SUMMING_UP) == \
+            DateTimeExprGenerator().generate(dt, dt_base=dt_base, situation=SUMMING_UP)
+
+    with pytest.raises(ValueError):
+        DateTimeExprGenerator(style=StyleProfile(range_joiner="-"))
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from konltk.nlg.datetime import DateTimeExprGenerator
+from konltk.nlg.summary import LineChange, ListSummary
+
+
+def test_list_summary_should_rerender_changed_day_groups(dt_range_list):
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    dt_range_list = [dt_range_list[i] for i in (0, 2, 3, 4)]
+    summary = ListSummary(dt_range_list, dt_base=dt_base, generator=dt_expr_generator)
+    assert summary.lines == dt_expr_generator.generate_list(dt_range_list, dt_base=dt_base)
+
+    event = (tz.localize(datetime(2018, 6, 7, 9)), tz.localize(datetime(2018, 6, 7, 10)), "회의")
+    assert summary.insert(event) == [LineChange("insert", 1, "\n6/7(목) 내일\n09:00 ~ 10:00 회의"),
+                                     LineChange("replace", 2, "10:00 ~ 12:00 (2시간)")]
+
+    moved = (tz.localize(datetime(2018, 6, 8, 12)), tz.localize(datetime(2018, 6, 8, 13)), "회의")
+    assert summary.update(event, moved) == [LineChange("delete", 1, "\n6/7(목) 내일\n09:00 ~ 10:00 회의"),
+                                            LineChange("replace", 1, "\n6/7(목) 내일\n10:00 ~ 12:00 (2시간)"),
+                                            LineChange("insert", 3, "12:00 ~ 13:00 회의")]
+    assert summary.remove(dt_range_list[2]) == [LineChange("delete", 2, "\n6/8(금) 모레\n11:00 ~ 13:00 (2시간)"),
+                                                LineChange("replace", 2, "\n6/8(금) 모레\n12:00 ~ 13:00 회의")]
+    assert summary.lines == dt_expr_generator.generate_list(summary.events, dt_base=dt_base)
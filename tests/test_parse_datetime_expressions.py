@@ -0,0 +1,58 @@
+from datetime import datetime
+from datetime import timedelta
+
+import pytest
+import pytz
+
+from konltk.nlg.datetime import DateTimeExprGenerator, SCHEDULING_DIALOG, SUMMING_UP
+from konltk.nlg.exceptions import DateTimeExprParseException
+from konltk.nlg.parser import DateTimeExprParser
+
+
+def test_datetime_expr_parser_should_parse_expressions():
+    dt_expr_parser = DateTimeExprParser()
+    tz = pytz.timezone('Asia/Seoul')
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    cases = [
+        ("오늘 오전 8시", datetime(2018, 6, 6, 8)),
+        ("내일 오후 10시 10분", datetime(2018, 6, 7, 22, 10)),
+        ("어제 오후 6시", datetime(2018, 6, 5, 18)),
+        ("이번주 월요일 오전 10시", datetime(2018, 6, 4, 10)),
+        ("토요일 오후 12시", datetime(2018, 6, 9, 12)),
+        ("지난주 금요일 오전 12시", datetime(2018, 6, 1)),
+        ("2018년 5월 30일 수요일, 오전 8시 21분", datetime(2018, 5, 30, 8, 21)),
+        ("7월 21일 토요일, 오후 3시 10분 30초", datetime(2018, 7, 21, 15, 10, 30)),
+        ("6/8(금) 11:00", datetime(2018, 6, 8, 11)),
+        ("2019/1/21(월) 15:00", datetime(2019, 1, 21, 15)),
+        ("다음주 월요일 오전 10시부터 오후 2시", (datetime(2018, 6, 11, 10), datetime(2018, 6, 11, 14))),
+        ("오늘 오후 3시부터 5시 30분", (datetime(2018, 6, 6, 15), datetime(2018, 6, 6, 17, 30))),
+        ("내일 오후 11시부터 모레 오전 1시", (datetime(2018, 6, 7, 23), datetime(2018, 6, 8, 1))),
+        ("7/21(토) 15:10 ~ 16:00 (50분)", (datetime(2018, 7, 21, 15, 10), datetime(2018, 7, 21, 16))),
+        ("6/9(토) 23:00 ~ 10(일) 01:00 (2시간)", (datetime(2018, 6, 9, 23), datetime(2018, 6, 10, 1))),
+    ]
+    for expr, expected in cases:
+        if isinstance(expected, tuple):
+            assert dt_expr_parser.parse(expr, dt_base=dt_base) == tuple(tz.localize(dt) for dt in expected)
+        else:
+            assert dt_expr_parser.parse(expr, dt_base=dt_base) == tz.localize(expected)
+
+    for expr in ["오후", "내일 오후 13시", "2월 30일 금요일, 오전 1시", "다음주 오후 1시", "내일 점심"]:
+        with pytest.raises(DateTimeExprParseException):
+            dt_expr_parser.parse(expr, dt_base=dt_base)
+
+
+def test_datetime_expr_parser_should_invert_generator():
+    dt_expr_generator = DateTimeExprGenerator()
+    dt_expr_parser = DateTimeExprParser()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    dt_list = [dt_base + timedelta(days=days, hours=hours, minutes=minutes)
+               for days in range(-400, 400, 13) for hours, minutes in [(-15, 0), (0, 10), (7, 30)]]
+    for situation in (SCHEDULING_DIALOG, SUMMING_UP):
+        for dt in dt_list:
+            for dt_end in (None, dt + timedelta(hours=1), dt + timedelta(days=3, minutes=10)):
+                expr = dt_expr_generator.generate(dt, dt_end, dt_base=dt_base, situation=situation)
+                expected = dt if dt_end is None else (dt, dt_end)
+                assert dt_expr_parser.parse(expr, dt_base=dt_base) == expected
@@ -0,0 +1,42 @@
+from datetime import datetime
+from datetime import timedelta
+
+import pytest
+
+from konltk.nlg.datetime import DateTimeExprGenerator, SUMMING_UP
+from konltk.nlg.recurrence import DAILY, MONTHLY, WEEKLY, Recurrence
+
+
+def test_recurrence_should_render_occurrences_lazily():
+    dt_expr_generator = DateTimeExprGenerator()
+    tz = dt_expr_generator.tz
+
+    dt_base = tz.localize(datetime(2018, 6, 6, 15))
+    standup = Recurrence(tz.localize(datetime(2018, 1, 1, 9)), DAILY, weekdays=(0, 1, 2, 3, 4),
+                         duration=timedelta(minutes=15), note="스탠드업")
+    occurrences = list(standup.between(dt_base, dt_base + timedelta(days=7)))
+    assert [dt.day for dt, _, _ in occurrences] == [7, 8, 11, 12, 13]
+    assert dt_expr_generator.generate_list(occurrences, dt_base=dt_base) == [
+        "6/7(목) 내일\n09:00 ~ 09:15 스탠드업",
+        "\n6/8(금) 모레\n09:00 ~ 09:15 스탠드업",
+        "\n6/11(월)\n09:00 ~ 09:15 스탠드업",
+        "\n6/12(화)\n09:00 ~ 09:15 스탠드업",
+        "\n6/13(수)\n09:00 ~ 09:15 스탠드업",
+    ]
+
+    # A window far from the start does not expand the occurrences before it.
+    dt_after = tz.localize(datetime(2118, 6, 6))
+    assert len(list(standup.between(dt_after, dt_after + timedelta(days=7)))) == 5
+    for kwargs in ({}, {"sort": True}):
+        with pytest.raises(ValueError):
+            dt_expr_generator.generate_list(standup, dt_base=dt_base, **kwargs)
+        with pytest.raises(ValueError):
+            dt_expr_generator.generate_list([standup, []], dt_base=dt_base, merge=True, **kwargs)
+
+    weekly = Recurrence(tz.localize(datetime(2018, 6, 4, 10)), WEEKLY, interval=2, weekdays=(0, 3), count=4)
+    assert [dt.day for dt, _, _ in weekly] == [4, 7, 18, 21]
+    assert dt_expr_generator.generate(weekly, dt_base=dt_base, situation=SUMMING_UP) == \
+        ["6/4(월) 10:00", "6/7(목) 10:00", "6/18(월) 10:00", "6/21(목) 10:00"]
+
+    monthly = Recurrence(tz.localize(datetime(2018, 1, 31, 10)), MONTHLY, until=tz.localize(datetime(2018, 8, 1)))
+    assert [dt.month for dt, _, _ in monthly] == [1, 3, 5, 7]
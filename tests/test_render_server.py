@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+
+from konltk.nlg.server import RenderServer
+
+
+def test_render_server_should_batch_concurrent_requests():
+    async def run():
+        server = RenderServer(window=0.05)
+        srv = await server.start(port=0)
+        port = srv.sockets[0].getsockname()[1]
+
+        requests = [{"dt": "2018-06-07T22:10:00+09:00", "dt_base": "2018-06-06T15:00:00+09:00"},
+                    {"dt": "2018-06-04T10:00:00+09:00", "dt_end": "2018-06-04T14:00:00+09:00",
+                     "dt_base": "2018-06-06T06:00:00+00:00", "situation": "summing_up"}]
+        exprs = await asyncio.gather(*(server.render(request) for request in requests))
+        assert exprs == ["내일 오후 10시 10분", "6/4(월) 10:00 ~ 14:00 (4시간)"]
+        assert server.stats()["batches"] == 1
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for body in (json.dumps(requests), '{"dt": "2018-06-07T22:10:00"}', '{"dt": "0001-01-01T00:00:00+09:00"}'):
+            body = body.encode("utf-8")
+            writer.write(b"POST /render HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+            status = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            payload = json.loads((await reader.readexactly(length)).decode("utf-8"))
+            if status.startswith(b"HTTP/1.1 200"):
+                assert payload == {"exprs": exprs}
+            else:
+                assert status.startswith((b"HTTP/1.1 400", b"HTTP/1.1 500")) and "error" in payload
+
+        stats = server.stats()
+        assert stats["requests"] == 6
+        assert 0 < stats["latency_ms"]["p50"] <= stats["latency_ms"]["p99"]
+
+        # Closing cancels the handler of the connection still open.
+        await server.close()
+        assert await reader.read() == b""
+        writer.close()
+
+    errors = []
+    loop = asyncio.new_event_loop()
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+    assert errors == []